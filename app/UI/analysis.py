@@ -5,6 +5,7 @@ from typing import List
 import streamlit as st
 
 from app.API.survey_data_provider import SurveyDataProvider
+from app.core.config import get_settings
 from app.models.analysis import SurveyAnalysisSnapshot
 from app.models.survey import SurveyQuestion
 from app.services.analysis_agent import SurveyAnalysisAgent
@@ -15,16 +16,37 @@ from . import state
 _AGENT_HISTORY_KEY = "analysis_agent_history"
 _AGENT_PROMPT_KEY = "analysis_agent_prompt"
 _AGENT_FORM_KEY = "analysis_agent_form"
+_AGENT_INSTANCE_KEY = "analysis_agent_instance"
 _MAX_AGENT_HISTORY = 5
 
 
-@st.cache_resource
-def _get_analysis_llm() -> LLM:
-    """Return a shared LLM instance for the analysis agent."""
+@st.cache_resource(show_spinner=False)
+def get_analysis_llm(model: str, api_key: str) -> LLM:
+    """Return a shared LLM instance for the analysis agent, keyed on its configuration."""
 
     return LLM()
 
 
+def _get_session_agent(questions: List[SurveyQuestion]) -> SurveyAnalysisAgent:
+    """Return this session's analysis agent so its answer cache survives reruns.
+
+    The agent is rebuilt when the survey questions change, e.g. after the survey file is reloaded.
+    """
+
+    state.track_key(_AGENT_INSTANCE_KEY)
+    stored = st.session_state.get(_AGENT_INSTANCE_KEY)
+    if stored is not None and stored[0] == list(questions):
+        return stored[1]
+
+    config = get_settings()
+    agent = SurveyAnalysisAgent(
+        SurveyDataProvider(questions),
+        llm=get_analysis_llm(config.llm_model, config.llm_api_key),
+    )
+    st.session_state[_AGENT_INSTANCE_KEY] = (list(questions), agent)
+    return agent
+
+
 def render_analysis(questions: List[SurveyQuestion]) -> None:
     """Render analysis details and the interactive agent for survey insights."""
 
@@ -37,17 +59,17 @@ def render_analysis(questions: List[SurveyQuestion]) -> None:
 
     if total_questions == 0:
         st.info("No survey questions available.")
-        agent = SurveyAnalysisAgent(provider, llm=_get_analysis_llm())
+        agent = _get_session_agent(questions)
         _render_agent_interface(agent, snapshot, enabled=False)
         return
 
     if answered == 0:
         st.info("Complete the survey to see insights once responses are recorded.")
-        agent = SurveyAnalysisAgent(provider, llm=_get_analysis_llm())
+        agent = _get_session_agent(questions)
         _render_agent_interface(agent, snapshot, enabled=False)
         return
 
-    agent = SurveyAnalysisAgent(provider, llm=_get_analysis_llm())
+    agent = _get_session_agent(questions)
     _render_agent_interface(agent, snapshot, enabled=True)
 
 
@@ -65,6 +87,8 @@ def _render_agent_interface(
         st.info("Complete the survey first to chat with the analysis agent.")
         return
 
+    state.track_key(_AGENT_HISTORY_KEY)
+    state.track_key(_AGENT_PROMPT_KEY)
     history: List[dict[str, str]] = st.session_state.setdefault(_AGENT_HISTORY_KEY, [])
 
     with st.form(_AGENT_FORM_KEY, clear_on_submit=True):
@@ -84,6 +108,8 @@ def _render_agent_interface(
             status_container = st.container()
             progress_placeholder = status_container.empty()
             message_placeholder = status_container.empty()
+            answer_placeholder = status_container.empty()
+            streamed_chunks: list[str] = []
 
             status_steps = [
                 ("fetching", "Fetching survey data..."),
@@ -94,21 +120,27 @@ def _render_agent_interface(
             completed_steps: set[str] = set()
             current_step: str | None = None
 
+            def _status_prefix(step: str, current: str | None) -> str:
+                if step in completed_steps:
+                    return "[x]"
+                if step == current:
+                    return "[>]"
+                return "[ ]"
+
             def render_status(current: str | None) -> None:
-                lines = []
-                for step, label in status_steps:
-                    if step in completed_steps:
-                        prefix = "[x]"
-                    elif step == current:
-                        prefix = "[>]"
-                    else:
-                        prefix = "[ ]"
-                    lines.append(f"- {prefix} {label}")
-                progress_placeholder.markdown("\n".join(lines))
+                progress_placeholder.markdown(
+                    "\n".join(f"- {_status_prefix(step, current)} {label}" for step, label in status_steps)
+                )
 
             def handle_status(step: str, message: str) -> None:
                 nonlocal current_step
+                if step == "token":
+                    streamed_chunks.append(message)
+                    answer_placeholder.markdown("".join(streamed_chunks))
+                    return
+
                 if step == "completed":
+                    answer_placeholder.empty()
                     completed_steps.update(step_order)
                     current_step = None
                     render_status(current_step)
@@ -14,6 +14,7 @@ from . import analysis, followups, speech_controls, state
 PLACEHOLDER_OPTION = "Select an option..."
 _LOGO_PATH = Path(__file__).parent / "images" / "deloitte.jpg"
 _PACMAN_PATH = Path(__file__).parent / "images" / "pacman.gif"
+_ANSWER_FLIPPED_KEY = "answer_flipped_in_callback"
 
 
 @lru_cache(maxsize=1)
@@ -330,12 +331,28 @@ def render_question_header(current_index: int, total_questions: int, question_te
     )
 
 
+@st.fragment
 def render_answer_widget(question: SurveyQuestion, index: int) -> None:
-    """Render the appropriate Streamlit widget for the survey question."""
+    """Render the appropriate Streamlit widget for the survey question.
 
+    Runs as a fragment so editing an answer only reruns this widget and its follow-up.
+    A full rerun is requested only when the question flips between answered and
+    unanswered, which is what the progress caption and navigation depend on.
+    """
+
+    was_answered = state.get_response(index) is not None
+    _render_answer_inputs(question, index)
+    # Widget callbacks run before this body, so a flip made by one is reported via session state.
+    flipped_in_callback = st.session_state.pop(_ANSWER_FLIPPED_KEY, False)
+    if flipped_in_callback or (state.get_response(index) is not None) != was_answered:
+        st.rerun()
+
+
+def _render_answer_inputs(question: SurveyQuestion, index: int) -> None:
     answer = question.answer
     widget_key = f"response_{index}"
     form_key = f"question_{index}"
+    state.track_key(widget_key)
 
     if answer.type == "categorical":
         options = [PLACEHOLDER_OPTION, *answer.choices]
@@ -344,13 +361,13 @@ def render_answer_widget(question: SurveyQuestion, index: int) -> None:
             default = state.get_response(index) or PLACEHOLDER_OPTION
             st.session_state[widget_key] = default if default in options else PLACEHOLDER_OPTION
 
-        selection = st.radio("Select an answer", options=options, key=widget_key)
-        if selection == PLACEHOLDER_OPTION:
-            state.clear_response(index, forget_widget=False)
-            followups.clear(index)
-        else:
-            state.set_response(index, selection)
-            followups.clear(index)
+        st.radio(
+            "Select an answer",
+            options=options,
+            key=widget_key,
+            on_change=_handle_choice_change,
+            args=(index,),
+        )
         return
 
     voice_key = f"{form_key}_voice_response"
@@ -394,10 +411,12 @@ def render_answer_widget(question: SurveyQuestion, index: int) -> None:
         if final_value:
             if state.get_response(index) != final_value:
                 state.set_response(index, final_value)
+                followups.prefetch(question, index, final_value)
         else:
             st.session_state.pop(voice_key, None)
-            state.clear_response(index)
-            followups.clear(index)
+            if state.get_response(index) is not None:
+                state.clear_response(index)
+                followups.clear(index)
 
         display_value = typed_value if typed_value else (voice_value or "")
         st.session_state[widget_key] = display_value
@@ -419,31 +438,46 @@ def render_answer_widget(question: SurveyQuestion, index: int) -> None:
     followups.render_followup_response_input(index)
 
 
-def render_summary(questions: List[SurveyQuestion]) -> None:
-    """Display a summary view of collected responses and follow-ups."""
+def _handle_choice_change(index: int) -> None:
+    """Persist a categorical selection when the radio value changes."""
 
-    st.success("Thank you for completing the survey!")
-    st.markdown("### Your responses")
+    was_answered = state.get_response(index) is not None
+    selection = st.session_state.get(f"response_{index}", PLACEHOLDER_OPTION)
+    followups.clear(index)
+    if selection == PLACEHOLDER_OPTION:
+        state.clear_response(index, forget_widget=False)
+    else:
+        state.set_response(index, selection)
+    if (state.get_response(index) is not None) != was_answered:
+        st.session_state[_ANSWER_FLIPPED_KEY] = True
+
+
+def _build_summary_markdown(questions: List[SurveyQuestion]) -> str:
+    """Compose the response summary as a single Markdown document."""
 
     followups_map = state.get_followups()
     followup_answers = state.get_followup_responses()
 
+    blocks: List[str] = []
     for idx, question in enumerate(questions):
-        st.markdown(f"**{question.question}**")
-        response = state.get_response(idx)
-        if response:
-            st.write(response)
-        else:
-            st.markdown("_No response recorded._")
+        blocks.append(f"**{question.question}**")
+        blocks.append(state.get_response(idx) or "_No response recorded._")
 
         entry = followups_map.get(idx)
         if entry and entry.get("text"):
-            st.markdown(f"{followups.FOLLOW_UP_LABEL}{entry['text']}")
-            followup_response = followup_answers.get(idx)
-            if followup_response:
-                st.write(followup_response)
-            else:
-                st.markdown("_No follow-up response recorded._")
+            blocks.append(f"{followups.FOLLOW_UP_LABEL}{entry['text']}")
+            blocks.append(followup_answers.get(idx) or "_No follow-up response recorded._")
+
+    return "\n\n".join(blocks)
+
+
+def render_summary(questions: List[SurveyQuestion]) -> None:
+    """Display a summary view of collected responses and follow-ups."""
+
+    st.success("Thank you for completing the survey!")
+    st.markdown("### Your responses")
+
+    st.markdown(_build_summary_markdown(questions))
 
     st.divider()
 
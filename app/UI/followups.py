@@ -1,23 +1,27 @@
 from __future__ import annotations
 
-from typing import Dict, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional, Sequence
 
 import streamlit as st
 
 from app.models.survey import SurveyQuestion
-from app.services.followup_agent import FollowUpAgent
+from app.services.followup_agent import FollowUpDecision, get_follow_up_agent
 
 from . import speech_controls, state
 
 FOLLOW_UP_LABEL = "**Follow-up question:** "
 FOLLOW_UP_RESPONSE_PREFIX = "followup_response_"
 
+# Shared by every session; each one keeps at most one decision in flight per question.
+_PREFETCH_WORKERS = 16
 
-@st.cache_resource
-def _get_agent() -> FollowUpAgent:
-    """Return the shared follow-up decision agent."""
 
-    return FollowUpAgent()
+@st.cache_resource(show_spinner=False)
+def _get_prefetch_executor() -> ThreadPoolExecutor:
+    """Return the process-wide pool that runs background follow-up decisions."""
+
+    return ThreadPoolExecutor(max_workers=_PREFETCH_WORKERS, thread_name_prefix="followup-prefetch")
 
 
 def _build_fallback_follow_up(question: str, answer: str) -> str:
@@ -39,85 +43,221 @@ def get_entry(index: int) -> Optional[Dict[str, object]]:
 def clear(index: int) -> None:
     """Remove cached follow-up question and response data for a question."""
 
-    state.clear_followup(index)
-    state.clear_followup_response(index)
-    state.clear_followup_requirement(index)
+    pending = state.get_followup_prefetch(index)
+    if pending:
+        pending[1].cancel()
+    state.clear_followup_data(index)
     st.session_state.pop(f"{FOLLOW_UP_RESPONSE_PREFIX}{index}", None)
 
 
-def maybe_generate(question: SurveyQuestion, index: int, answer_text: str) -> None:
-    """Generate and cache a follow-up question for a free-text response."""
+def prefetch(question: SurveyQuestion, index: int, answer_text: str) -> None:
+    """Start deciding on a follow-up in the background as soon as an answer is recorded.
+
+    The decision is picked up by ``maybe_generate``/``generate_pending`` when the user
+    navigates on, so the LLM round-trip overlaps with the time spent before clicking Next.
+    Every committed edit starts a new decision and cancels the one it supersedes.
+    """
 
     cleaned = answer_text.strip()
     if not cleaned:
-        clear(index)
         return
 
     entry = get_entry(index)
     if entry and entry.get("answer") == cleaned:
         return
 
+    pending = state.get_followup_prefetch(index)
+    if pending and pending[0] == cleaned:
+        return
+    if pending:
+        # Superseded by a newer answer; drop it if it has not started so the shared pool stays free.
+        pending[1].cancel()
+
+    future = _get_prefetch_executor().submit(get_follow_up_agent().decide, question.question, cleaned)
+    state.set_followup_prefetch(index, cleaned, future)
+
+
+def _take_prefetched(index: int, cleaned: str) -> Optional[Future]:
+    """Return the background decision for ``cleaned`` if one was started."""
+
+    pending = state.pop_followup_prefetch(index)
+    if pending is None:
+        return None
+    if pending[0] == cleaned:
+        return pending[1]
+    pending[1].cancel()
+    return None
+
+
+def maybe_generate(question: SurveyQuestion, index: int, answer_text: str) -> bool:
+    """Start or collect the follow-up decision for a free-text response without blocking.
+
+    The decision runs on the prefetch executor; callers poll by calling this again and
+    get ``True`` back while it is still being computed. A decision already prefetched
+    for the same answer is reused; otherwise one is started for the submitted text.
+    """
+
+    cleaned = answer_text.strip()
+    if not cleaned:
+        clear(index)
+        return False
+
+    entry = get_entry(index)
+    if entry and entry.get("answer") == cleaned:
+        return False
+
+    if entry is not None:
+        state.clear_followup(index)
+        st.session_state.pop(f"{FOLLOW_UP_RESPONSE_PREFIX}{index}", None)
     state.clear_followup_response(index)
     state.mark_followup_required(index)
 
+    prefetch(question, index, cleaned)
+    pending = state.get_followup_prefetch(index)
+    if pending is None or not pending[1].done():
+        return pending is not None
+
+    state.pop_followup_prefetch(index)
     try:
-        state.set_generating_followup(True)
-        with st.spinner("Generating follow-up question..."):
-            decision = _get_agent().decide(question.question, cleaned)
+        decision = pending[1].result()
     except Exception as exc:  # pragma: no cover - UI feedback path
-        fallback_text = _build_fallback_follow_up(question.question, cleaned)
+        _store_fallback(question, index, cleaned)
+        # The caller reruns straight away, so the warning is shown on the next run.
+        state.set_followup_notice(
+            "Using a fallback follow-up question while the AI helper is unavailable.",
+            f"Follow-up generation error: {exc}",
+        )
+    else:
+        _store_decision(question, index, cleaned, decision)
+    return False
+
+
+def render_notice() -> None:
+    """Show the warning queued by a failed follow-up generation, once."""
+
+    notice = state.pop_followup_notice()
+    if notice is None:
+        return
+
+    message, detail = notice
+    st.warning(message)
+    st.caption(detail)
+
+
+def generate_pending(questions: Sequence[SurveyQuestion]) -> None:
+    """Generate follow-ups for every answered free-text question lacking a current one in one batch."""
+
+    pending: list[tuple[int, SurveyQuestion, str]] = []
+    for index, question in enumerate(questions):
+        if question.answer.type != "free_text":
+            continue
+        cleaned = (state.get_response(index) or "").strip()
+        if not cleaned:
+            continue
+        entry = get_entry(index)
+        if entry and entry.get("answer") == cleaned:
+            continue
+        pending.append((index, question, cleaned))
+
+    if not pending:
+        return
+
+    for index, _, _ in pending:
+        state.clear_followup_response(index)
+        state.mark_followup_required(index)
+
+    failures: dict[int, Exception] = {}
+    decisions: dict[int, FollowUpDecision] = {}
+    try:
+        state.set_generating_followup(True)
+        with st.spinner("Generating follow-up questions..."):
+            prefetched = {index: _take_prefetched(index, cleaned) for index, _, cleaned in pending}
+            remaining = [item for item in pending if prefetched[item[0]] is None]
+            if remaining:
+                try:
+                    decided = get_follow_up_agent().decide_batch(
+                        [(question.question, cleaned) for _, question, cleaned in remaining]
+                    )
+                except Exception as exc:  # pragma: no cover - UI feedback path
+                    failures.update((index, exc) for index, _, _ in remaining)
+                else:
+                    decisions.update(zip((index for index, _, _ in remaining), decided))
+            for index, future in prefetched.items():
+                if future is None:
+                    continue
+                # Resolve each prefetch on its own so one failed run does not discard the others.
+                try:
+                    decisions[index] = future.result()
+                except Exception as exc:  # pragma: no cover - UI feedback path
+                    failures[index] = exc
+    finally:
+        state.set_generating_followup(False)
+
+    for index, question, cleaned in pending:
+        if index in decisions:
+            _store_decision(question, index, cleaned, decisions[index])
+        else:
+            _store_fallback(question, index, cleaned)
+
+    if failures:
+        state.set_followup_notice(
+            "Using fallback follow-up questions while the AI helper is unavailable.",
+            f"Follow-up generation error: {next(iter(failures.values()))}",
+        )
+
+
+def _store_fallback(question: SurveyQuestion, index: int, cleaned: str) -> None:
+    """Cache the deterministic fallback follow-up for a question."""
+
+    state.set_followup(
+        index,
+        {
+            "answer": cleaned,
+            "text": _build_fallback_follow_up(question.question, cleaned),
+            "displayed": False,
+            "source": "fallback",
+            "should_ask": True,
+            "rationale": None,
+        },
+    )
+
+
+def _store_decision(question: SurveyQuestion, index: int, cleaned: str, decision: FollowUpDecision) -> None:
+    """Cache the agent's follow-up decision for a question."""
+
+    rationale = getattr(decision, "rationale", None)
+    if not getattr(decision, "should_ask", False):
         state.set_followup(
             index,
             {
                 "answer": cleaned,
-                "text": fallback_text,
-                "displayed": False,
-                "source": "fallback",
-                "should_ask": True,
-                "rationale": None,
+                "text": None,
+                "displayed": True,
+                "source": "agent_skip",
+                "should_ask": False,
+                "rationale": rationale,
             },
         )
-        st.warning("Using a fallback follow-up question while the AI helper is unavailable.")
-        st.caption(f"Follow-up generation error: {exc}")
-    else:
-        rationale = getattr(decision, "rationale", None)
-        if not getattr(decision, "should_ask", False):
-            state.set_followup(
-                index,
-                {
-                    "answer": cleaned,
-                    "text": None,
-                    "displayed": True,
-                    "source": "agent_skip",
-                    "should_ask": False,
-                    "rationale": rationale,
-                },
-            )
-            state.clear_followup_requirement(index)
-        else:
-            followup_text = (decision.follow_up_question or "").strip()
-            if not followup_text:
-                followup_text = _build_fallback_follow_up(question.question, cleaned)
-                source = "fallback_empty"
-            else:
-                source = "agent"
-            state.set_followup(
-                index,
-                {
-                    "answer": cleaned,
-                    "text": followup_text,
-                    "displayed": False,
-                    "source": source,
-                    "should_ask": True,
-                    "rationale": rationale,
-                },
-            )
-    finally:
-        state.set_generating_followup(False)
-
-    entry = get_entry(index)
-    if entry and entry.get("should_ask") is False:
         state.clear_followup_requirement(index)
+        return
+
+    followup_text = (decision.follow_up_question or "").strip()
+    if not followup_text:
+        followup_text = _build_fallback_follow_up(question.question, cleaned)
+        source = "fallback_empty"
+    else:
+        source = "agent"
+    state.set_followup(
+        index,
+        {
+            "answer": cleaned,
+            "text": followup_text,
+            "displayed": False,
+            "source": source,
+            "should_ask": True,
+            "rationale": rationale,
+        },
+    )
 
 
 def render_followup_question(index: int) -> None:
@@ -148,26 +288,38 @@ def render_followup_question(index: int) -> None:
     )
 
 
+@st.fragment
 def render_followup_response_input(index: int) -> None:
-    """Render a text area to capture the user's follow-up response."""
+    """Render a text area to capture the user's follow-up response.
+
+    Runs as a fragment; the whole app reruns only when the follow-up requirement
+    changes so the navigation buttons pick up the new gating state.
+    """
+
+    was_pending = state.is_followup_requirement_pending(index)
+    _render_followup_response_inputs(index)
+    if state.is_followup_requirement_pending(index) != was_pending:
+        st.rerun()
+
 
+def _render_followup_response_inputs(index: int) -> None:
     entry = get_entry(index)
     if not entry or not entry.get("text"):
         return
 
-    placeholder = st.container()
+    placeholder = st.empty()
     if entry.get("displayed") is False:
-        placeholder.empty()
         return
 
     response_key = f"{FOLLOW_UP_RESPONSE_PREFIX}{index}"
     voice_key = f"{response_key}_voice_response"
+    state.track_key(response_key)
     existing = state.get_followup_responses().get(index, "")
 
     if response_key not in st.session_state:
         st.session_state[response_key] = existing
 
-    with placeholder:
+    with placeholder.container():
         text_col, mic_col = st.columns([12, 1], vertical_alignment="bottom")
         with mic_col:
             speech_controls.render_audio_record_button(
@@ -201,16 +353,20 @@ def render_followup_response_input(index: int) -> None:
                 final_value = voice_value or ""
 
             if final_value:
-                state.set_followup_response(index, final_value)
-                state.clear_followup_requirement(index)
+                if existing != final_value:
+                    state.set_followup_response(index, final_value)
+                if state.is_followup_requirement_pending(index):
+                    state.clear_followup_requirement(index)
             else:
                 st.session_state.pop(voice_key, None)
-                state.clear_followup_response(index)
-                if entry and entry.get("text"):
+                if existing:
+                    state.clear_followup_response(index)
+                if not state.is_followup_requirement_pending(index):
                     state.mark_followup_required(index)
 
             display_value = typed_value if typed_value else (voice_value or "")
-            st.session_state[response_key] = display_value
+            if st.session_state.get(response_key) != display_value:
+                st.session_state[response_key] = display_value
 
             st.text_area(
                 "Your follow-up answer",
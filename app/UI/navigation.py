@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Sequence
+
 import streamlit as st
 
 from app.models.survey import SurveyQuestion
@@ -9,15 +11,20 @@ from app.services.survey_database import SurveyResultRecord, get_survey_database
 
 from . import followups, state
 
+_FOLLOWUP_POLL_SECONDS = 0.5
+
 
-def render(question: SurveyQuestion, total_questions: int) -> None:
+def render(questions: Sequence[SurveyQuestion], question: SurveyQuestion) -> None:
     """Render navigation controls for moving through the survey."""
 
+    total_questions = len(questions)
     current_index = state.get_current_index()
     prev_disabled = current_index == 0
     next_disabled = current_index >= max(total_questions - 1, 0)
     finish_disabled = current_index != max(total_questions - 1, 0)
 
+    followups.render_notice()
+
     followup_entry = state.get_followups().get(current_index) or {}
     is_generating = state.is_generating_followup()
 
@@ -29,10 +36,17 @@ def render(question: SurveyQuestion, total_questions: int) -> None:
         and state.is_followup_requirement_pending(current_index)
     )
 
+    awaiting_decision = False
+    if followup_required and not followup_entry.get("text"):
+        awaiting_decision = followups.maybe_generate(question, current_index, state.get_response(current_index) or "")
+        if not awaiting_decision:
+            _advance_if_skipped(current_index, total_questions)
+            st.rerun()
+
     reminder_message: str | None = None
     reminder_level = "info"
 
-    if is_generating:
+    if is_generating or awaiting_decision:
         reminder_message = "Generating a follow-up question—please wait."
         next_disabled = True
         finish_disabled = True
@@ -118,6 +132,7 @@ def render(question: SurveyQuestion, total_questions: int) -> None:
         state.mark_complete(False)
 
     def _finish() -> None:
+        followups.generate_pending(questions)
         if not _ensure_followup_completed():
             return
         responses_snapshot = {
@@ -150,3 +165,25 @@ def render(question: SurveyQuestion, total_questions: int) -> None:
         st.button("Next", on_click=_go_next, disabled=next_disabled)
     with finish_col:
         st.button("Finish Survey", on_click=_finish, disabled=finish_disabled)
+
+    if awaiting_decision:
+        _poll_followup_decision(question, current_index, total_questions)
+
+
+@st.fragment(run_every=_FOLLOWUP_POLL_SECONDS)
+def _poll_followup_decision(question: SurveyQuestion, index: int, total_questions: int) -> None:
+    """Poll the background follow-up decision, rerunning the whole app only once it lands."""
+
+    if followups.maybe_generate(question, index, state.get_response(index) or ""):
+        return
+    _advance_if_skipped(index, total_questions)
+    st.rerun()
+
+
+def _advance_if_skipped(index: int, total_questions: int) -> None:
+    """Move past the question when the agent decided no follow-up is needed."""
+
+    decided = state.get_followups().get(index) or {}
+    if decided.get("should_ask") is False and index < total_questions - 1:
+        state.increment_index(total_questions)
+        state.mark_complete(False)
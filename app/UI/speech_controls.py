@@ -2,14 +2,15 @@ from __future__ import annotations
 
 import base64
 import hashlib
-import time
+import html
+from types import MappingProxyType
 from typing import Any, Dict, Sequence
 
 import streamlit as st
 import streamlit.components.v1 as components
 
-from app.core.config import settings
-from app.services.speech import OpenAISpeechService, SpeechServiceError
+from app.core.config import get_settings
+from app.services.speech import SpeechService, SpeechServiceError, create_speech_service
 
 _AUDIO_CACHE_KEY = "speech_audio_cache"
 _AUTO_TTS_STATE_KEY = "speech_auto_tts_enabled"
@@ -17,19 +18,37 @@ _AUTO_TTS_BUTTON_KEY = "speech_auto_tts_button"
 _QUESTION_INDEX_TRACK_KEY = "speech_last_question_index"
 _AUDIO_EVENT_STATE_KEY = "speech_audio_events"
 _TYPEWRITER_DONE_KEY = "speech_typewriter_complete"
-_TYPEWRITER_DELAY_SECONDS = 0.0425
 _SESSION_VERSION_KEY = "speech_audio_session_version"
 _RECORDING_STATE_SUFFIX = "_recording_active"
 _AUDIO_WIDGET_SUFFIX = "_audio_input"
 _AUDIO_CACHE_META_KEY = "speech_audio_cache_meta"
 _PREFETCH_STATE_KEY = "speech_question_prefetch_state"
+_TYPEWRITER_WORD_DELAY_SECONDS = 0.05
+_FORMAT_MIME_TYPES = MappingProxyType(
+    {
+        "mp3": "audio/mpeg",
+        "aac": "audio/aac",
+        "flac": "audio/flac",
+        "wav": "audio/wav",
+        "ogg": "audio/ogg",
+        "opus": "audio/ogg",
+        "pcm": "audio/wav",
+    }
+)
+_TYPEWRITER_STYLE = (
+    "<style>"
+    ".survey-typewriter span{opacity:0;animation:survey-typewriter-in 0.1s forwards}"
+    "@keyframes survey-typewriter-in{to{opacity:1}}"
+    "</style>"
+)
 
 
 @st.cache_resource
-def get_speech_service() -> OpenAISpeechService:
-    """Instantiate and cache the OpenAI-backed speech service."""
+def get_speech_service() -> SpeechService:
+    """Instantiate and cache the speech service for the configured provider."""
 
-    return OpenAISpeechService(api_key=settings.llm_api_key, settings=settings.speech)
+    config = get_settings()
+    return create_speech_service(api_key=config.llm_api_key, settings=config.speech)
 
 
 def render_tts_toggle(
@@ -122,6 +141,16 @@ def autoplay_question(text: str, *, cache_id: str, enabled: bool) -> bool:
     return True
 
 
+def _typewriter_markup(text: str) -> str:
+    """Wrap each word in a span revealed by a staggered CSS animation in the browser."""
+
+    words = " ".join(
+        f'<span style="animation-delay:{position * _TYPEWRITER_WORD_DELAY_SECONDS:.2f}s">{html.escape(word)}</span>'
+        for position, word in enumerate(text.split())
+    )
+    return f'{_TYPEWRITER_STYLE}<span class="survey-typewriter">{words}</span>'
+
+
 def render_question_text(text: str, *, cache_id: str, animate: bool, prefix_markdown: str | None = None) -> None:
     """Display the question text, syncing a typewriter effect with playback."""
 
@@ -158,12 +187,7 @@ def render_question_text(text: str, *, cache_id: str, animate: bool, prefix_mark
         _render_output(cleaned)
         return
 
-    accumulated = ""
-    for word in cleaned.split():
-        accumulated = (accumulated + " " + word).strip()
-        _render_output(accumulated)
-        time.sleep(_TYPEWRITER_DELAY_SECONDS)
-
+    placeholder.markdown(f"{prefix_markdown or ''}{_typewriter_markup(cleaned)}", unsafe_allow_html=True)
     _typewriter_state()[cache_id] = True
 
 
@@ -289,7 +313,7 @@ def _render_autoplay_audio(
     autoplay: bool,
     text_version: str,
 ) -> None:
-    mime = _format_to_mime(settings.speech.tts_format)
+    mime = _format_to_mime(get_settings().speech.tts_format)
     b64_content = base64.b64encode(audio_bytes).decode("ascii")
     audio_id = f"audio_{cache_id}"
     auto_flag = "true" if autoplay else "false"
@@ -419,16 +443,7 @@ def _get_audio_cache_meta() -> Dict[str, str]:
 
 
 def _format_to_mime(fmt: str) -> str:
-    lookup = {
-        "mp3": "audio/mpeg",
-        "aac": "audio/aac",
-        "flac": "audio/flac",
-        "wav": "audio/wav",
-        "ogg": "audio/ogg",
-        "opus": "audio/ogg",
-        "pcm": "audio/wav",
-    }
-    return lookup.get((fmt or "mp3").lower(), "audio/mpeg")
+    return _FORMAT_MIME_TYPES.get((fmt or "mp3").lower(), "audio/mpeg")
 
 
 def prefetch_question_audio(question_texts: Sequence[str]) -> Dict[str, Any]:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from concurrent.futures import Future
+from typing import Any, Dict, Optional, Set, Tuple
 
 import streamlit as st
 
@@ -12,7 +13,10 @@ FOLLOWUPS_KEY = "followups"
 FOLLOWUP_RESPONSES_KEY = "followup_responses"
 GENERATING_FOLLOWUP_KEY = "generating_followup"
 FOLLOWUP_REQUIRED_KEY = "followup_required"
+FOLLOWUP_PREFETCH_KEY = "followup_prefetch"
+FOLLOWUP_NOTICE_KEY = "followup_notice"
 ANALYSIS_VISIBLE_KEY = "analysis_visible"
+TRACKED_KEYS_KEY = "tracked_keys"
 
 
 def reset() -> None:
@@ -26,13 +30,13 @@ def reset() -> None:
     st.session_state[FOLLOWUP_RESPONSES_KEY] = {}
     st.session_state[GENERATING_FOLLOWUP_KEY] = False
     st.session_state[FOLLOWUP_REQUIRED_KEY] = {}
+    st.session_state[FOLLOWUP_PREFETCH_KEY] = {}
+    st.session_state[FOLLOWUP_NOTICE_KEY] = None
     st.session_state[ANALYSIS_VISIBLE_KEY] = False
 
-    for key in [name for name in st.session_state.keys() if name.startswith("response_")]:
-        del st.session_state[key]
-
-    for key in [name for name in st.session_state.keys() if name.startswith("analysis_agent_")]:
-        del st.session_state[key]
+    for key in st.session_state.get(TRACKED_KEYS_KEY, ()):
+        st.session_state.pop(key, None)
+    st.session_state[TRACKED_KEYS_KEY] = set()
 
 
 def ensure_defaults(total_questions: int) -> None:
@@ -46,7 +50,10 @@ def ensure_defaults(total_questions: int) -> None:
     st.session_state.setdefault(FOLLOWUP_RESPONSES_KEY, {})
     st.session_state.setdefault(GENERATING_FOLLOWUP_KEY, False)
     st.session_state.setdefault(FOLLOWUP_REQUIRED_KEY, {})
+    st.session_state.setdefault(FOLLOWUP_PREFETCH_KEY, {})
+    st.session_state.setdefault(FOLLOWUP_NOTICE_KEY, None)
     st.session_state.setdefault(ANALYSIS_VISIBLE_KEY, False)
+    st.session_state.setdefault(TRACKED_KEYS_KEY, set())
 
     if total_questions == 0:
         st.session_state[CURRENT_INDEX_KEY] = 0
@@ -56,6 +63,13 @@ def ensure_defaults(total_questions: int) -> None:
         st.session_state[CURRENT_INDEX_KEY] = total_questions - 1
 
 
+def track_key(key: str) -> None:
+    """Register a per-survey session state key so ``reset`` can discard it."""
+
+    tracked: Set[str] = st.session_state.setdefault(TRACKED_KEYS_KEY, set())
+    tracked.add(key)
+
+
 def get_current_index() -> int:
     """Return the active question index."""
 
@@ -168,6 +182,13 @@ def clear_followup(index: int) -> None:
     clear_followup_requirement(index)
 
 
+def clear_followup_data(index: int) -> None:
+    """Remove the follow-up question, response, requirement and prefetch for a question."""
+
+    for key in (FOLLOWUPS_KEY, FOLLOWUP_RESPONSES_KEY, FOLLOWUP_REQUIRED_KEY, FOLLOWUP_PREFETCH_KEY):
+        st.session_state[key].pop(index, None)
+
+
 def get_followup_responses() -> Dict[int, str]:
     """Return the map of follow-up answers keyed by question index."""
 
@@ -216,6 +237,38 @@ def is_followup_requirement_pending(index: int) -> bool:
     return bool(st.session_state[FOLLOWUP_REQUIRED_KEY].get(index))
 
 
+def get_followup_prefetch(index: int) -> Optional[Tuple[str, Future]]:
+    """Return the in-flight follow-up decision for a question as ``(answer, future)``."""
+
+    return st.session_state[FOLLOWUP_PREFETCH_KEY].get(index)
+
+
+def set_followup_prefetch(index: int, answer: str, future: Future) -> None:
+    """Remember a background follow-up decision started for the given answer."""
+
+    st.session_state[FOLLOWUP_PREFETCH_KEY][index] = (answer, future)
+
+
+def pop_followup_prefetch(index: int) -> Optional[Tuple[str, Future]]:
+    """Remove and return the in-flight follow-up decision for a question."""
+
+    return st.session_state[FOLLOWUP_PREFETCH_KEY].pop(index, None)
+
+
+def set_followup_notice(message: str, detail: str) -> None:
+    """Queue a follow-up generation warning to show on the next run."""
+
+    st.session_state[FOLLOWUP_NOTICE_KEY] = (message, detail)
+
+
+def pop_followup_notice() -> Optional[Tuple[str, str]]:
+    """Remove and return the queued follow-up warning as ``(message, detail)``."""
+
+    notice = st.session_state.get(FOLLOWUP_NOTICE_KEY)
+    st.session_state[FOLLOWUP_NOTICE_KEY] = None
+    return notice
+
+
 def set_analysis_visible(is_visible: bool) -> None:
     """Persist whether the analysis section should be displayed."""
 
@@ -1,19 +1,58 @@
 from __future__ import annotations
 
+import threading
+from pathlib import Path
+from typing import Callable
+
 import streamlit as st
 
-from app.UI import components, navigation, speech_controls, state
-from app.core.config import settings
+from app.UI import analysis, components, navigation, speech_controls, state
+from app.core.config import get_settings
+from app.models.survey import Survey
+from app.services.followup_agent import get_follow_up_agent
 from app.services.survey_loader import SurveyLoader
 
 
+@st.cache_data(show_spinner=False)
+def _load_survey(path: str, mtime: float) -> Survey:
+    """Parse the survey file, cached until its modification time changes."""
+
+    return SurveyLoader(Path(path)).survey
+
+
+@st.cache_resource(show_spinner=False)
+def _start_client_warmup() -> threading.Thread:
+    """Warm the LLM, follow-up agent and speech clients once per process in the background."""
+
+    # Clients are resolved inside the worker so a failing constructor cannot break the script run.
+    config = get_settings()
+    tasks: list[Callable[[], object]] = [
+        get_follow_up_agent,
+        lambda: analysis.get_analysis_llm(config.llm_model, config.llm_api_key).warmup(),
+        lambda: speech_controls.get_speech_service().warmup(),
+    ]
+
+    def _run() -> None:
+        for task in tasks:
+            try:
+                task()
+            except Exception:  # pragma: no cover - warm-up is best effort
+                continue
+
+    worker = threading.Thread(target=_run, name="client-warmup", daemon=True)
+    worker.start()
+    return worker
+
+
 def run_app() -> None:
     """Entry point for the Streamlit-based survey UI."""
 
     st.set_page_config(page_title="Survey Assistant", page_icon="📝", layout="centered")
+    _start_client_warmup()
 
     try:
-        survey = SurveyLoader(settings.survey_file_path).survey
+        survey_path = get_settings().survey_file_path
+        survey = _load_survey(str(survey_path), survey_path.stat().st_mtime)
     except FileNotFoundError as exc:
         st.error(str(exc))
         return
@@ -49,4 +88,4 @@ def run_app() -> None:
     answered_count = state.responses_count()
     st.caption(f"Answered {answered_count} of {total_questions} questions")
 
-    navigation.render(question, total_questions)
+    navigation.render(questions, question)
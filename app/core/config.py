@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from dotenv import load_dotenv
 
-load_dotenv()
+_DOTENV_FLAG = "_DOTENV_LOADED"
 
 
 def _strip_or_none(value: Optional[str]) -> Optional[str]:
@@ -25,45 +26,79 @@ class SpeechSettings:
     tts_voice: Optional[str]
     tts_format: str
     language: Optional[str] = None
+    preprocess_audio: bool = False
+
+
+def _env(*names: str, default: Optional[str] = None) -> Optional[str]:
+    """Return the first non-blank value among the given environment variables."""
+
+    for name in names:
+        value = _strip_or_none(os.environ.get(name))
+        if value:
+            return value
+    return default
+
+
+def _env_path(name: str, default: str) -> Path:
+    return Path(_env(name, default=default)).expanduser().resolve()
+
+
+def _env_flag(name: str) -> bool:
+    return (_env(name) or "").lower() in {"1", "true", "yes", "on"}
 
 
 class Settings:
 
     def __init__(self) -> None:
-        api_key = _strip_or_none(os.getenv("LLM_API_KEY")) or _strip_or_none(os.getenv("OPENAI_API_KEY"))
+        api_key = _env("LLM_API_KEY", "OPENAI_API_KEY")
         if not api_key:
             raise RuntimeError("Missing LLM/OpenAI API key in environment or .env file.")
         self.llm_api_key = api_key
 
-        model_name = _strip_or_none(os.getenv("LLM_MODEL")) or _strip_or_none(os.getenv("OPENAI_MODEL"))
+        model_name = _env("LLM_MODEL", "OPENAI_MODEL")
         if not model_name:
             raise RuntimeError("Missing LLM/OpenAI model name in environment or .env file.")
         self.llm_model = model_name
 
-        survey_path = _strip_or_none(os.getenv("SURVEY_FILE_PATH")) or "app/data/strategic_outcomes_survey.txt"
-        self.survey_file_path = Path(survey_path).expanduser().resolve()
+        self.survey_file_path = _env_path("SURVEY_FILE_PATH", "app/data/strategic_outcomes_survey.txt")
         if not self.survey_file_path.is_file():
             raise RuntimeError(f"Survey file not found at {self.survey_file_path}")
 
-        results_path = _strip_or_none(os.getenv("SURVEY_RESULTS_PATH")) or "app/data/survey_results.txt"
-        self.survey_results_path = Path(results_path).expanduser().resolve()
+        self.survey_results_path = _env_path("SURVEY_RESULTS_PATH", "app/data/survey_results.txt")
         self.survey_results_path.parent.mkdir(parents=True, exist_ok=True)
 
-        speech_provider = _strip_or_none(os.getenv("SPEECH_PROVIDER")) or "openai"
-        speech_stt_model = _strip_or_none(os.getenv("SPEECH_STT_MODEL")) or "whisper-1"
-        speech_tts_model = _strip_or_none(os.getenv("SPEECH_TTS_MODEL")) or "gpt-4o-mini-tts"
-        speech_tts_voice = _strip_or_none(os.getenv("SPEECH_TTS_VOICE")) or "nova"
-        speech_tts_format = _strip_or_none(os.getenv("SPEECH_TTS_FORMAT")) or "mp3"
-        speech_language = _strip_or_none(os.getenv("SPEECH_LANGUAGE"))
+        self.llm_cache_path = _env_path("LLM_CACHE_PATH", "app/data/llm_cache.db")
+        self.llm_cache_path.parent.mkdir(parents=True, exist_ok=True)
 
         self.speech = SpeechSettings(
-            provider=speech_provider,
-            stt_model=speech_stt_model,
-            tts_model=speech_tts_model,
-            tts_voice=speech_tts_voice,
-            tts_format=speech_tts_format,
-            language=speech_language,
+            provider=_env("SPEECH_PROVIDER", default="openai"),
+            stt_model=_env("SPEECH_STT_MODEL", default="whisper-1"),
+            tts_model=_env("SPEECH_TTS_MODEL", default="gpt-4o-mini-tts"),
+            tts_voice=_env("SPEECH_TTS_VOICE", default="nova"),
+            tts_format=_env("SPEECH_TTS_FORMAT", default="mp3"),
+            language=_env("SPEECH_LANGUAGE"),
+            preprocess_audio=_env_flag("SPEECH_PREPROCESS_AUDIO"),
         )
 
 
-settings = Settings()
+def _load_environment() -> None:
+    """Parse ``.env`` unless this process (or its parent) already did."""
+
+    if os.environ.get(_DOTENV_FLAG):
+        return
+    load_dotenv()
+    os.environ[_DOTENV_FLAG] = "1"
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load the environment and build the application settings once per process."""
+
+    _load_environment()
+    return Settings()
+
+
+def __getattr__(name: str) -> Any:
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -12,11 +12,13 @@ if os.getenv("DEBUG_ATTACH") == "1":
         debugpy.wait_for_client()
         print("✅ Debugger attached!")
 from app.UI import run_app
+from app.services.LLM import configure_llm_cache
 
 
 def main() -> None:
     """Launch the Streamlit survey UI."""
 
+    configure_llm_cache()
     run_app()
 
 
@@ -30,6 +30,20 @@ class QuestionInsight(BaseModel):
 
         return bool(self.follow_up_response and self.follow_up_response.strip())
 
+    def format_section(self) -> str:
+        """Format this question's context for an LLM prompt."""
+
+        base = (
+            f"Question {self.index + 1}: {self.question}\n"
+            f"Primary answer: {self.response or 'No response provided.'}"
+        )
+        if self.follow_up_question:
+            follow_up_answer = self.follow_up_response or "Not provided."
+            return f"{base}\nFollow-up question: {self.follow_up_question}\nFollow-up answer: {follow_up_answer}"
+        if self.follow_up_response:
+            return f"{base}\nFollow-up answer: {self.follow_up_response}"
+        return base
+
 
 class SurveyAnalysisSnapshot(BaseModel):
     """Container describing the state of a survey for analysis purposes."""
@@ -51,3 +65,13 @@ class SurveyAnalysisSnapshot(BaseModel):
         """Count how many questions include a primary response."""
 
         return sum(1 for question in self.questions if question.has_primary_response)
+
+    def format_context(self) -> str:
+        """Format the answered questions for an LLM prompt."""
+
+        sections = [
+            question.format_section()
+            for question in self.questions
+            if question.has_primary_response or question.has_follow_up_response
+        ]
+        return "\n\n".join(sections) if sections else "No answered questions."
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, Iterator, Optional
 
+from langchain_community.cache import SQLiteCache
+from langchain_core.globals import get_llm_cache, set_llm_cache
+from langchain_core.load import dumps
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration
 from langchain_openai import ChatOpenAI
 
-from app.core.config import settings
+from app.core.config import get_settings
 
 
 class LLMInterface(ABC):
@@ -15,35 +22,113 @@ class LLMInterface(ABC):
         """Execute the language model with the provided prompt."""
         raise NotImplementedError
 
+    def stream(self, prompt: str) -> Iterator[str]:
+        """Yield the response in text chunks as they arrive; the default yields it whole."""
+        yield self(prompt)
+
+    def warmup(self) -> None:
+        """Prepare the backend ahead of the first prompt; the default does nothing."""
+
+
+@lru_cache(maxsize=1)
+def configure_llm_cache() -> None:
+    """Install the persistent LangChain response cache once per process."""
+
+    set_llm_cache(SQLiteCache(database_path=str(get_settings().llm_cache_path)))
+
+
+@lru_cache(maxsize=4)
+def _build_chat_client(model: str, api_key: str, temperature: float) -> ChatOpenAI:
+    """Return a shared chat client for the given model configuration."""
+
+    return ChatOpenAI(model=model, api_key=api_key, temperature=temperature)
+
 
 class LLM(LLMInterface):
     """Stateless LangChain wrapper around the configured OpenAI chat model."""
 
     def __init__(self) -> None:
-        self._client = ChatOpenAI(
-            model=settings.llm_model,
-            api_key=settings.llm_api_key,
-            temperature=0.2,
-        )
+        config = get_settings()
+        self._client = _build_chat_client(config.llm_model, config.llm_api_key, 0.2)
 
     def __call__(self, prompt: str) -> str:
         if not isinstance(prompt, str):
             raise TypeError("prompt must be a string")
 
-        result = self._client.invoke(prompt)
-        if isinstance(result, str):
-            return result
-
-        content = getattr(result, "content", "")
-        if isinstance(content, str):
-            return content
-        if isinstance(content, list):
-            parts = []
-            for item in content:
-                if isinstance(item, dict):
-                    parts.append(str(item.get("text", "")))
-                else:
-                    parts.append(str(item))
-            return "".join(parts)
-
-        return str(result)
+        return _extract_text(self._client.invoke(prompt))
+
+    def warmup(self) -> None:
+        self._client.root_client.models.retrieve(self._client.model_name)
+
+    def stream(self, prompt: str) -> Iterator[str]:
+        if not isinstance(prompt, str):
+            raise TypeError("prompt must be a string")
+
+        # ``BaseChatModel.stream`` skips the global LLM cache, so look it up and fill it here
+        # with the same key ``invoke`` uses; cached answers are replayed as a single chunk.
+        llm_cache = get_llm_cache() if self._client.cache is not False else None
+        llm_string = _cache_llm_string(self._client) if llm_cache is not None else None
+        if llm_cache is None or llm_string is None:
+            yield from self._stream_chunks(prompt)
+            return
+
+        cache_prompt = dumps([HumanMessage(content=prompt)])
+        cached = llm_cache.lookup(cache_prompt, llm_string)
+        if cached:
+            yield "".join(generation.text for generation in cached)
+            return
+
+        chunks: list[str] = []
+        for text in self._stream_chunks(prompt):
+            chunks.append(text)
+            yield text
+        if chunks:
+            message = AIMessage(content="".join(chunks))
+            llm_cache.update(cache_prompt, llm_string, [ChatGeneration(message=message)])
+
+    def _stream_chunks(self, prompt: str) -> Iterator[str]:
+        for chunk in self._client.stream(prompt):
+            text = _extract_text(chunk)
+            if text:
+                yield text
+
+
+def _cache_llm_string(client: ChatOpenAI) -> Optional[str]:
+    """Return the model half of the LLM cache key ``invoke`` uses, or ``None`` to skip the cache.
+
+    langchain-core (0.3 through 1.x) keys chat generations on the private
+    ``BaseChatModel._get_llm_string()``; if that method disappears or changes, streaming
+    simply bypasses the cache rather than failing or writing entries ``invoke`` never reads.
+    """
+
+    get_llm_string = getattr(client, "_get_llm_string", None)
+    if get_llm_string is None:
+        return None
+    try:
+        llm_string = get_llm_string()
+    except Exception:  # pragma: no cover - depends on the installed langchain-core
+        return None
+    return llm_string if isinstance(llm_string, str) else None
+
+
+def _extract_text(result: Any) -> str:
+    """Return the text content of a chat model result."""
+
+    content = getattr(result, "content", None)
+    if isinstance(content, str):
+        return content
+    return _extract_text_slow(result, content)
+
+
+def _extract_text_slow(result: Any, content: Any) -> str:
+    """Cold path for raw strings, content-part lists and unexpected result types."""
+
+    if isinstance(result, str):
+        return result
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "".join(
+            str(item.get("text", "")) if isinstance(item, dict) else str(item) for item in content
+        )
+    return str(result)
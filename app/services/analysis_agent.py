@@ -1,14 +1,35 @@
 from __future__ import annotations
 
-import threading
-import time
+import hashlib
+from collections import OrderedDict
 from textwrap import dedent
 from typing import Callable
 
 from app.API.survey_data_provider import SurveyDataProvider
-from app.models.analysis import QuestionInsight, SurveyAnalysisSnapshot
+from app.models.analysis import SurveyAnalysisSnapshot
 from app.services.LLM import LLM, LLMInterface
 
+_ANSWER_CACHE_SIZE = 64
+_PROMPT_TEMPLATE = dedent(
+    """
+    You are a survey analysis assistant. You will receive a collection of survey questions
+    along with the participant's primary answers and optional follow-up discussions that are not necessarily the same for each survey.
+    Use only this information to answer the user's question. Do not invent data and make clear
+    when the available responses are insufficient.
+
+    Survey overview:
+      - Survey id: {survey_id}
+      - Answered questions: {answered_count} / {total_questions}
+
+    Survey responses:
+    {context_block}
+
+    User question: {query}
+
+    The format of the answer should be structured in bullet points and concise
+    """
+).strip()
+
 
 class SurveyAnalysisAgent:
     """LLM-backed agent that answers questions about the captured survey data."""
@@ -24,6 +45,8 @@ class SurveyAnalysisAgent:
 
         self._provider = data_provider
         self._llm = llm or LLM()
+        self._answers: OrderedDict[str, str] = OrderedDict()
+        self.cache_hits = 0
 
     def answer(
         self,
@@ -42,6 +65,7 @@ class SurveyAnalysisAgent:
             if status_callback:
                 status_callback(step, message)
 
+        notify("fetching", "Fetching survey data...")
         snapshot = self._provider.get_survey_snapshot(survey_id)
         if snapshot.total_questions == 0:
             notify("completed", "No survey questions are available to analyse.")
@@ -50,80 +74,53 @@ class SurveyAnalysisAgent:
             notify("completed", "No responses have been recorded for this survey yet.")
             return "No responses have been recorded for this survey yet."
 
+        notify("reading", "Reading survey responses...")
         prompt = self._build_prompt(cleaned_query, snapshot)
-        result_holder: dict[str, str] = {}
-        error_holder: dict[str, Exception] = {}
-
-        def _call_llm() -> None:
-            try:
-                result_holder["value"] = self._llm(prompt).strip()
-            except Exception as exc:  # pragma: no cover - delegated to runtime
-                error_holder["error"] = exc
-
-        worker = threading.Thread(target=_call_llm, daemon=True)
-        worker.start()
-
-        for step, message in (
-            ("fetching", "Fetching survey data..."),
-            ("reading", "Reading survey responses..."),
-        ):
-            notify(step, message)
-            time.sleep(1)
+        cache_key = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).hexdigest()
+        cached = self._answers.get(cache_key)
+        if cached is not None:
+            self._answers.move_to_end(cache_key)
+            self.cache_hits += 1
+            notify("completed", "Analysis complete.")
+            return cached
 
         notify("thinking", "Thinking through the available survey responses...")
-
-        worker.join()
-        if "error" in error_holder:
+        try:
+            if status_callback:
+                chunks: list[str] = []
+                for chunk in self._llm.stream(prompt):
+                    chunks.append(chunk)
+                    notify("token", chunk)
+                answer = "".join(chunks).strip()
+            else:
+                answer = self._llm(prompt).strip()
+        except Exception as exc:  # pragma: no cover - delegated to runtime
             notify("completed", "Unable to complete analysis.")
-            exc = error_holder["error"]
             return f"I couldn't generate an answer right now: {exc}"
 
-        answer = result_holder.get("value", "") or "I couldn't find relevant information to answer that question."
+        if answer:
+            self._answers[cache_key] = answer
+            if len(self._answers) > _ANSWER_CACHE_SIZE:
+                self._answers.popitem(last=False)
+        else:
+            answer = "I couldn't find relevant information to answer that question."
         notify("completed", "Analysis complete.")
         return answer
 
+    def warmup(self) -> None:
+        """Open the LLM connection ahead of the first query."""
+
+        self._llm.warmup()
+
     def _build_prompt(self, query: str, snapshot: SurveyAnalysisSnapshot) -> str:
         """Create the LLM prompt using the provided snapshot and user query."""
 
-        answered_sections = [
-            self._format_question_section(question)
-            for question in snapshot.questions
-            if question.has_primary_response or question.has_follow_up_response
-        ]
-        context_block = "\n\n".join(answered_sections) if answered_sections else "No answered questions."
-
-        return dedent(
-            f"""
-            You are a survey analysis assistant. You will receive a collection of survey questions
-            along with the participant's primary answers and optional follow-up discussions that are not necessarily the same for each survey.
-            Use only this information to answer the user's question. Do not invent data and make clear
-            when the available responses are insufficient.
-
-            Survey overview:
-              - Survey id: {snapshot.survey_id}
-              - Answered questions: {snapshot.answered_count} / {snapshot.total_questions}
-
-            Survey responses:
-            {context_block}
-
-            User question: {query}
-
-            The format of the answer should be structured in bullet points and concise
-            """
-        ).strip()
-
-    def _format_question_section(self, question: QuestionInsight) -> str:
-        """Format a single question's context for the LLM prompt."""
-
-        lines = [
-            f"Question {question.index + 1}: {question.question}",
-            f"Primary answer: {question.response or 'No response provided.'}",
-        ]
-        if question.follow_up_question:
-            lines.append(f"Follow-up question: {question.follow_up_question}")
-        if question.follow_up_response:
-            lines.append(f"Follow-up answer: {question.follow_up_response}")
-        elif question.follow_up_question:
-            lines.append("Follow-up answer: Not provided.")
-
-        return "\n".join(lines)
+        context_block = snapshot.format_context()
+
+        return _PROMPT_TEMPLATE.format(
+            survey_id=snapshot.survey_id,
+            answered_count=snapshot.answered_count,
+            total_questions=snapshot.total_questions,
+            context_block=context_block,
+            query=query,
+        )
@@ -4,11 +4,13 @@ import re
 from collections import Counter
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Iterable, List, Sequence, Tuple
+from typing import List, Mapping, Sequence, Tuple
 
 from app.API.survey_data_provider import SurveyDataProvider
 from app.models.analysis import QuestionInsight, SurveyAnalysisSnapshot
 
+_TOKEN_RE = re.compile(r"[A-Za-z0-9']+")
+
 
 class ChartType(str, Enum):
     """Supported chart shapes for survey visualisations."""
@@ -17,7 +19,7 @@ class ChartType(str, Enum):
     PIE = "pie"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChartData:
     """Structured payload describing a chart for the UI layer."""
 
@@ -28,7 +30,7 @@ class ChartData:
     question_index: int | None = None
     question_text: str | None = None
     description: str | None = None
-    metadata: dict[str, int | float | str] = field(default_factory=dict)
+    metadata: Mapping[str, int | float | str] = field(default_factory=dict)
 
     def to_series(self) -> List[Tuple[str, float]]:
         """Return data as a list of (label, value) tuples."""
@@ -95,13 +97,10 @@ class SurveyChartBuilder:
     ) -> ChartData:
         """Return chart data for a single survey question."""
 
-        question = self._provider.get_question_response(index, survey_id or self._default_survey_id)
-        resolved_type = self._resolve_chart_type(chart_type, question)
-        if resolved_type == ChartType.BAR:
-            return self._build_bar_chart(question)
-        if resolved_type == ChartType.PIE:
-            return self._build_pie_chart(question)
-        raise ValueError(f"Unsupported chart type: {resolved_type}")
+        snapshot = self._snapshot(survey_id)
+        if not 0 <= index < snapshot.total_questions:
+            raise IndexError(f"Question index out of range: {index}")
+        return self._question_chart_from_insight(snapshot.questions[index], chart_type)
 
     def all_question_charts(
         self,
@@ -112,12 +111,23 @@ class SurveyChartBuilder:
         """Return chart data for each question with at least one recorded response."""
 
         snapshot = self._snapshot(survey_id)
-        charts: List[ChartData] = []
-        for question in snapshot.questions:
-            if not question.has_primary_response and not question.has_follow_up_response:
-                continue
-            charts.append(self.question_chart(question.index, chart_type=chart_type, survey_id=survey_id))
-        return charts
+        return [
+            self._question_chart_from_insight(question, chart_type)
+            for question in snapshot.questions
+            if question.has_primary_response or question.has_follow_up_response
+        ]
+
+    def _question_chart_from_insight(
+        self,
+        question: QuestionInsight,
+        chart_type: ChartType | str | None,
+    ) -> ChartData:
+        resolved_type = self._resolve_chart_type(chart_type, question)
+        if resolved_type == ChartType.BAR:
+            return self._build_bar_chart(question)
+        if resolved_type == ChartType.PIE:
+            return self._build_pie_chart(question)
+        raise ValueError(f"Unsupported chart type: {resolved_type}")
 
     def _snapshot(self, survey_id: str | None) -> SurveyAnalysisSnapshot:
         target = survey_id or self._default_survey_id
@@ -158,7 +168,7 @@ class SurveyChartBuilder:
             chart_type=ChartType.BAR,
             labels=labels,
             values=values,
-            title=f"Responses for question {question.index + 1}",
+            title=_question_title(question),
             question_index=question.index,
             question_text=question.question,
             description=description,
@@ -171,7 +181,7 @@ class SurveyChartBuilder:
             chart_type=ChartType.PIE,
             labels=labels,
             values=values,
-            title=f"Responses for question {question.index + 1}",
+            title=_question_title(question),
             question_index=question.index,
             question_text=question.question,
             description="Choice distribution for the recorded response.",
@@ -182,12 +192,13 @@ class SurveyChartBuilder:
         if question.answer_type != "categorical":
             raise ValueError("Categorical distribution requested for non-categorical question.")
 
-        labels: List[str] = []
-        values: List[float] = []
+        labels = list(question.choices)
+        values = [0.0] * len(labels)
         recorded_choice = (question.response or "").strip()
-        for choice in question.choices:
-            labels.append(choice)
-            values.append(1.0 if choice == recorded_choice else 0.0)
+        try:
+            values[labels.index(recorded_choice)] = 1.0
+        except ValueError:
+            pass
 
         if not labels:
             labels.append("No choices configured")
@@ -215,10 +226,12 @@ class SurveyChartBuilder:
         return labels, values
 
     @staticmethod
-    def _tokenise(text: str) -> Iterable[str]:
-        for token in re.findall(r"[A-Za-z0-9']+", text.lower()):
-            if token:
-                yield token
+    def _tokenise(text: str) -> List[str]:
+        return _TOKEN_RE.findall(text.lower())
+
+
+def _question_title(question: QuestionInsight) -> str:
+    return f"Responses for question {question.index + 1}"
 
 
 __all__ = [
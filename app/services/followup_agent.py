@@ -1,12 +1,40 @@
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from textwrap import dedent
+from typing import Optional, Sequence
 
 from pydantic import BaseModel, Field
 from pydantic_ai import Agent, exceptions as ai_exceptions
 from pydantic_ai.settings import ModelSettings
 
-from app.core.config import settings
+from app.core.config import get_settings
+
+_DECISION_CACHE_SIZE = 256
+_BATCH_SIZE = 8
+
+_INSTRUCTIONS = dedent(
+    """
+    You are a professional survey assistant tasked with judging whether a follow-up question is needed.
+    Consider the original survey question and the respondent's answer.
+
+    - Return `should_ask = true` when you need more detail to understand the answer.
+      Include a concise follow_up_question that invites elaboration.
+    - Return `should_ask = false` when the answer is already specific enough or a follow up question would not make sense.
+      Set follow_up_question to null in that case.
+
+    Avoid repeating the original question verbatim and keep follow-up questions single-sentence and neutral.
+    """
+).strip()
+_BATCH_INSTRUCTIONS = (
+    f"{_INSTRUCTIONS}\n\n"
+    "You will receive several numbered pairs of survey question and respondent answer. "
+    "Return a list with exactly one recommendation per pair, in the same order as the pairs."
+)
+_PROMPT_HEAD = "Survey question: "
+_PROMPT_ANSWER = "\nRespondent answer: "
+_PROMPT_TAIL = "\n\nProvide your recommendation."
 
 
 class FollowUpDecision(BaseModel):
@@ -30,27 +58,26 @@ class FollowUpAgent:
     """Thin wrapper around a PydanticAI agent for deciding follow-up questions."""
 
     _agent: Agent[None, FollowUpDecision]
+    _batch_agent: Agent[None, list[FollowUpDecision]]
 
     def __init__(self) -> None:
-        model_name = settings.llm_model
+        self._cache: OrderedDict[tuple[str, str], FollowUpDecision] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+
+        model_name = get_settings().llm_model
         provider_spec = f"openai:{model_name}"
         try:
             self._agent = Agent(
                 provider_spec,
                 output_type=FollowUpDecision,
-                instructions=dedent(
-                    """
-                    You are a professional survey assistant tasked with judging whether a follow-up question is needed.
-                    Consider the original survey question and the respondent's answer.
-
-                    - Return `should_ask = true` when you need more detail to understand the answer.
-                      Include a concise follow_up_question that invites elaboration.
-                    - Return `should_ask = false` when the answer is already specific enough or a follow up question would not make sense.
-                      Set follow_up_question to null in that case.
-
-                    Avoid repeating the original question verbatim and keep follow-up questions single-sentence and neutral.
-                    """
-                ).strip(),
+                instructions=_INSTRUCTIONS,
+                model_settings=ModelSettings(temperature=0.2),
+            )
+            self._batch_agent = Agent(
+                provider_spec,
+                output_type=list[FollowUpDecision],
+                instructions=_BATCH_INSTRUCTIONS,
                 model_settings=ModelSettings(temperature=0.2),
             )
         except Exception as exc:
@@ -59,23 +86,102 @@ class FollowUpAgent:
     def decide(self, question: str, response: str) -> FollowUpDecision:
         """Run the agent and return its structured recommendation."""
 
-        if not question or not response:
-            raise ValueError("Both question and response must be provided.")
-
-        prompt = dedent(
-            f"""
-            Survey question: {question}
-            Respondent answer: {response}
-
-            Provide your recommendation.
-            """
-        ).strip()
+        cache_key = self._validate(question, response)
+        cached = self._lookup(cache_key)
+        if cached is not None:
+            return cached
 
         try:
-            run_result = self._agent.run_sync(prompt)
+            run_result = self._agent.run_sync(_build_prompt(question, response))
         except (ai_exceptions.AgentRunError, ai_exceptions.UserError) as exc:  # pragma: no cover - runtime path
             raise RuntimeError(f"Follow-up agent failed: {exc}") from exc
         except Exception as exc:  # pragma: no cover - runtime path
             raise RuntimeError(f"Follow-up agent encountered an unexpected error: {exc}") from exc
 
-        return run_result.output
+        return self._remember(cache_key, run_result.output)
+
+    def decide_batch(self, pairs: Sequence[tuple[str, str]]) -> list[FollowUpDecision]:
+        """Decide on several pairs with one agent run per batch of up to eight uncached pairs.
+
+        Falls back to :meth:`decide` for single-pair batches and whenever the agent returns
+        a different number of decisions than pairs it was given.
+        """
+
+        cache_keys = [self._validate(question, response) for question, response in pairs]
+        decisions: list[FollowUpDecision | None] = [self._lookup(cache_key) for cache_key in cache_keys]
+        missing = [position for position, decision in enumerate(decisions) if decision is None]
+
+        for start in range(0, len(missing), _BATCH_SIZE):
+            chunk = missing[start : start + _BATCH_SIZE]
+            outputs: list[FollowUpDecision] = []
+            if len(chunk) > 1:
+                prompt = _build_batch_prompt([pairs[position] for position in chunk])
+                try:
+                    run_result = self._batch_agent.run_sync(prompt)
+                except (ai_exceptions.AgentRunError, ai_exceptions.UserError) as exc:  # pragma: no cover - runtime path
+                    raise RuntimeError(f"Follow-up agent failed: {exc}") from exc
+                except Exception as exc:  # pragma: no cover - runtime path
+                    raise RuntimeError(f"Follow-up agent encountered an unexpected error: {exc}") from exc
+                outputs = run_result.output
+
+            if len(outputs) != len(chunk):
+                for position in chunk:
+                    decisions[position] = self.decide(*pairs[position])
+                continue
+            for position, decision in zip(chunk, outputs):
+                decisions[position] = self._remember(cache_keys[position], decision)
+
+        return [decision for decision in decisions if decision is not None]
+
+    @staticmethod
+    def _validate(question: str, response: str) -> tuple[str, str]:
+        if not question or not response:
+            raise ValueError("Both question and response must be provided.")
+        return question, response
+
+    def _lookup(self, cache_key: tuple[str, str]) -> FollowUpDecision | None:
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+            if cached is None:
+                return None
+            self._cache.move_to_end(cache_key)
+            self.cache_hits += 1
+            return cached.model_copy()
+
+    def _remember(self, cache_key: tuple[str, str], decision: FollowUpDecision) -> FollowUpDecision:
+        with self._cache_lock:
+            self._cache[cache_key] = decision
+            if len(self._cache) > _DECISION_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return decision.model_copy()
+
+
+_AGENT_INSTANCE: Optional[FollowUpAgent] = None
+_AGENT_LOCK = threading.Lock()
+
+
+def get_follow_up_agent() -> FollowUpAgent:
+    """Return the shared follow-up agent instance."""
+
+    global _AGENT_INSTANCE
+    if _AGENT_INSTANCE is None:
+        with _AGENT_LOCK:
+            if _AGENT_INSTANCE is None:
+                _AGENT_INSTANCE = FollowUpAgent()
+    return _AGENT_INSTANCE
+
+
+def _build_prompt(question: str, response: str) -> str:
+    """Return the user prompt for a single (question, response) pair."""
+
+    return "".join((_PROMPT_HEAD, question, _PROMPT_ANSWER, response, _PROMPT_TAIL))
+
+
+def _build_batch_prompt(pairs: Sequence[tuple[str, str]]) -> str:
+    """Return the user prompt listing several numbered (question, response) pairs."""
+
+    sections = (
+        "".join((f"Pair {number}:\n", _PROMPT_HEAD, question, _PROMPT_ANSWER, response))
+        for number, (question, response) in enumerate(pairs, start=1)
+    )
+    return "".join((f"There are {len(pairs)} pairs.\n\n", "\n\n".join(sections), _PROMPT_TAIL))
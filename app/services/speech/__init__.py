@@ -1,4 +1,38 @@
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from app.core.config import SpeechSettings
+
 from .base import SpeechService, SpeechServiceError
-from .openai_service import OpenAISpeechService
 
-__all__ = ["SpeechService", "SpeechServiceError", "OpenAISpeechService"]
+if TYPE_CHECKING:
+    from .openai_service import OpenAISpeechService
+
+_PROVIDERS = {
+    "openai": (".openai_service", "OpenAISpeechService"),
+}
+
+
+def create_speech_service(*, api_key: str, settings: SpeechSettings) -> SpeechService:
+    """Build the speech service for the configured provider, importing only that provider's module."""
+
+    provider = settings.provider.strip().lower()
+    try:
+        module_name, class_name = _PROVIDERS[provider]
+    except KeyError as exc:
+        # Callers only handle SpeechServiceError, so a bad setting disables speech instead of crashing.
+        raise SpeechServiceError(f"Unsupported speech provider: {settings.provider!r}") from exc
+    service_cls = getattr(import_module(module_name, __name__), class_name)
+    return service_cls(api_key=api_key, settings=settings)
+
+
+def __getattr__(name: str) -> Any:
+    for module_name, class_name in _PROVIDERS.values():
+        if name == class_name:
+            return getattr(import_module(module_name, __name__), class_name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["SpeechService", "SpeechServiceError", "OpenAISpeechService", "create_speech_service"]
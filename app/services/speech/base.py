@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Protocol, runtime_checkable
 
 
@@ -16,3 +17,28 @@ class SpeechService(Protocol):
 
     def synthesize(self, text: str, *, voice: str | None = None, response_format: str | None = None) -> bytes:
         """Convert text into audio bytes ready for playback."""
+
+    def warmup(self) -> None:
+        """Prepare the backend ahead of the first request; the default does nothing."""
+
+    async def transcribe_async(
+        self,
+        audio: bytes,
+        *,
+        mime_type: str | None = None,
+        language: str | None = None,
+    ) -> str:
+        """Transcribe on a worker thread so the running event loop is not blocked."""
+
+        return await asyncio.to_thread(self.transcribe, audio, mime_type=mime_type, language=language)
+
+    async def synthesize_async(
+        self,
+        text: str,
+        *,
+        voice: str | None = None,
+        response_format: str | None = None,
+    ) -> bytes:
+        """Synthesize on a worker thread so the running event loop is not blocked."""
+
+        return await asyncio.to_thread(self.synthesize, text, voice=voice, response_format=response_format)
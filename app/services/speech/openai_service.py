@@ -1,16 +1,29 @@
 from __future__ import annotations
 
+import hashlib
 import io
 import mimetypes
-from typing import Any, Dict, Optional
-
-from openai import OpenAI
+import re
+import sys
+import threading
+import wave
+from array import array
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Deque, Dict, Iterator, Optional
 
 from app.core.config import SpeechSettings
 
 from .base import SpeechService, SpeechServiceError
 
 _FALLBACK_EXTENSION = ".wav"
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+_PIPELINE_DEPTH = 2
+_TTS_CACHE_SIZE = 256
+_STREAM_CHUNK_SIZE = 4096
+_CONCATENABLE_FORMATS = frozenset({"mp3", "pcm"})
+_TARGET_SAMPLE_RATE = 16_000
 
 
 class OpenAISpeechService(SpeechService):
@@ -19,24 +32,36 @@ class OpenAISpeechService(SpeechService):
     def __init__(self, *, api_key: str, settings: SpeechSettings) -> None:
         if not api_key:
             raise ValueError("An OpenAI API key is required for the speech service.")
+
+        # Imported here so loading this module does not pull in the OpenAI SDK until a client is needed.
+        from openai import OpenAI
+
         self._client = OpenAI(api_key=api_key)
         self._stt_model = settings.stt_model
         self._tts_model = settings.tts_model
         self._default_voice = settings.tts_voice or "alloy"
         self._response_format = settings.tts_format or "mp3"
         self._language = settings.language
+        self._preprocess_audio = settings.preprocess_audio
+        self._tts_cache: OrderedDict[str, bytes] = OrderedDict()
+        self._tts_cache_lock = threading.Lock()
+
+    def warmup(self) -> None:
+        """Open the API connection ahead of the first request with a token-free metadata call."""
+
+        self._client.models.retrieve(self._tts_model)
 
     def transcribe(self, audio: bytes, *, mime_type: str | None = None, language: str | None = None) -> str:
         if not audio:
             raise ValueError("Audio bytes must be provided for transcription.")
 
         language_code = language or self._language
-        filename = f"input{self._resolve_extension(mime_type)}"
-
-        audio_stream = io.BytesIO(audio)
-        audio_stream.name = filename  # type: ignore[attr-defined]
+        extension = self._resolve_extension(mime_type)
+        if self._preprocess_audio and extension == ".wav":
+            audio = _downsample_wav(audio)
+        upload = (f"input{extension}", audio, mime_type or "audio/wav")
 
-        request_args: Dict[str, Any] = {"model": self._stt_model, "file": audio_stream}
+        request_args: Dict[str, Any] = {"model": self._stt_model, "file": upload}
         if language_code:
             request_args["language"] = language_code
 
@@ -51,15 +76,12 @@ class OpenAISpeechService(SpeechService):
         return text.strip()
 
     def synthesize(self, text: str, *, voice: str | None = None, response_format: str | None = None) -> bytes:
-        cleaned = (text or "").strip()
-        if not cleaned:
-            raise ValueError("Text must be provided for synthesis.")
-
-        target_voice = voice or self._default_voice
-        if not target_voice:
-            raise ValueError("A target voice must be configured for text-to-speech synthesis.")
+        cleaned, target_voice, target_format = self._synthesis_request(text, voice, response_format)
 
-        target_format = response_format or self._response_format or "mp3"
+        cache_key = _tts_cache_key(cleaned, self._tts_model, target_voice, target_format)
+        cached = self._cached_audio(cache_key)
+        if cached is not None:
+            return cached
 
         speech_response = self._client.audio.speech.create(
             model=self._tts_model,
@@ -74,18 +96,183 @@ class OpenAISpeechService(SpeechService):
         if not audio_bytes:
             raise SpeechServiceError("OpenAI text-to-speech request returned no audio bytes.")
 
+        self._remember_audio(cache_key, audio_bytes)
         return audio_bytes
 
+    def synthesize_stream(
+        self,
+        text: str,
+        *,
+        voice: str | None = None,
+        response_format: str | None = None,
+    ) -> Iterator[bytes]:
+        """Yield audio in chunks as the response body arrives instead of buffering it whole.
+
+        Cached audio is yielded as a single chunk; a fully streamed response is cached afterwards.
+        """
+
+        cleaned, target_voice, target_format = self._synthesis_request(text, voice, response_format)
+
+        cache_key = _tts_cache_key(cleaned, self._tts_model, target_voice, target_format)
+        cached = self._cached_audio(cache_key)
+        if cached is not None:
+            yield cached
+            return
+
+        chunks: list[bytes] = []
+        with self._client.audio.speech.with_streaming_response.create(
+            model=self._tts_model,
+            voice=target_voice,
+            input=cleaned,
+            response_format=target_format,
+        ) as speech_response:
+            for chunk in speech_response.iter_bytes(chunk_size=_STREAM_CHUNK_SIZE):
+                chunks.append(chunk)
+                yield chunk
+
+        if not chunks:
+            raise SpeechServiceError("OpenAI text-to-speech request returned no audio bytes.")
+
+        self._remember_audio(cache_key, b"".join(chunks))
+
+    def synthesize_sentences(
+        self,
+        text: str,
+        *,
+        voice: str | None = None,
+        response_format: str | None = None,
+    ) -> Iterator[bytes]:
+        """Yield audio sentence by sentence, synthesizing the next one while the caller consumes the current.
+
+        Only formats whose chunks concatenate into one valid stream are supported: MP3 frames
+        and raw PCM. Container formats such as WAV declare their length up front.
+        """
+
+        cleaned = (text or "").strip()
+        if not cleaned:
+            raise ValueError("Text must be provided for synthesis.")
+
+        target_format = response_format or self._response_format or "mp3"
+        if target_format not in _CONCATENABLE_FORMATS:
+            raise ValueError(f"Sentence streaming does not support the {target_format!r} format.")
+        sentences = [sentence for sentence in _SENTENCE_SPLIT_RE.split(cleaned) if sentence]
+
+        with ThreadPoolExecutor(max_workers=_PIPELINE_DEPTH, thread_name_prefix="tts-sentences") as executor:
+            pending: Deque[Future[bytes]] = deque()
+            remaining = iter(sentences)
+            for sentence in remaining:
+                pending.append(executor.submit(self.synthesize, sentence, voice=voice, response_format=target_format))
+                if len(pending) == _PIPELINE_DEPTH:
+                    break
+
+            while pending:
+                audio_bytes = pending.popleft().result()
+                next_sentence = next(remaining, None)
+                if next_sentence is not None:
+                    pending.append(
+                        executor.submit(self.synthesize, next_sentence, voice=voice, response_format=target_format)
+                    )
+                yield audio_bytes
+
+    def _synthesis_request(
+        self,
+        text: str,
+        voice: str | None,
+        response_format: str | None,
+    ) -> tuple[str, str, str]:
+        cleaned = (text or "").strip()
+        if not cleaned:
+            raise ValueError("Text must be provided for synthesis.")
+
+        target_voice = voice or self._default_voice
+        if not target_voice:
+            raise ValueError("A target voice must be configured for text-to-speech synthesis.")
+
+        return cleaned, target_voice, response_format or self._response_format or "mp3"
+
+    def _cached_audio(self, cache_key: str) -> bytes | None:
+        with self._tts_cache_lock:
+            cached = self._tts_cache.get(cache_key)
+            if cached is not None:
+                self._tts_cache.move_to_end(cache_key)
+            return cached
+
+    def _remember_audio(self, cache_key: str, audio_bytes: bytes) -> None:
+        with self._tts_cache_lock:
+            self._tts_cache[cache_key] = audio_bytes
+            if len(self._tts_cache) > _TTS_CACHE_SIZE:
+                self._tts_cache.popitem(last=False)
+
     @staticmethod
     def _resolve_extension(mime_type: Optional[str]) -> str:
         if not mime_type:
             return _FALLBACK_EXTENSION
+        return _extension_for_mime(mime_type)
+
+
+@lru_cache(maxsize=64)
+def _extension_for_mime(mime_type: str) -> str:
+    """Map a MIME type to a file extension, caching the ``mimetypes`` lookup."""
+
+    mime_type = mime_type.partition(";")[0].strip()
+    guessed = mimetypes.guess_extension(mime_type)
+    if guessed:
+        return guessed
+
+    if mime_type == "audio/mpeg":
+        return ".mp3"
+
+    return _FALLBACK_EXTENSION
+
+
+def _tts_cache_key(text: str, model: str, voice: str, response_format: str) -> str:
+    """Return a compact cache key for a synthesis request."""
+
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+    return f"{digest}:{model}:{voice}:{response_format}"
+
+
+def _downsample_wav(audio_bytes: bytes) -> bytes:
+    """Reduce 16-bit PCM WAV audio to mono at roughly 16 kHz, returning other input unchanged.
+
+    Each output sample is the mean of one decimation window across all channels. That box
+    filter is a cheap anti-aliasing step which speech recognition is happy with, and the
+    upload shrinks by the channel count times the decimation step.
+    """
+
+    try:
+        with wave.open(io.BytesIO(audio_bytes), "rb") as reader:
+            channels = reader.getnchannels()
+            sample_width = reader.getsampwidth()
+            frame_rate = reader.getframerate()
+            frames = reader.readframes(reader.getnframes())
+    except (wave.Error, EOFError):
+        return audio_bytes
+
+    step = max(frame_rate // _TARGET_SAMPLE_RATE, 1)
+    if sample_width != 2 or (channels == 1 and step == 1):
+        return audio_bytes
+
+    # Drop a truncated trailing sample or window rather than failing on it.
+    window = channels * step
+    frames = frames[: len(frames) - len(frames) % (window * sample_width)]
+    if not frames:
+        return audio_bytes
 
-        guessed = mimetypes.guess_extension(mime_type)
-        if guessed:
-            return guessed
+    samples = array("h")
+    samples.frombytes(frames)
+    if sys.byteorder == "big":
+        samples.byteswap()  # WAV samples are little-endian; array uses native order.
 
-        if mime_type == "audio/mpeg":
-            return ".mp3"
+    columns = [samples[offset::window] for offset in range(window)]
+    reduced = array("h", (total // window for total in map(sum, zip(*columns))))
+    if sys.byteorder == "big":
+        reduced.byteswap()
 
-        return _FALLBACK_EXTENSION
+    output = io.BytesIO()
+    with wave.open(output, "wb") as writer:
+        writer.setnchannels(1)
+        writer.setsampwidth(2)
+        writer.setframerate(frame_rate // step)
+        writer.writeframes(reduced.tobytes())
+    return output.getvalue()
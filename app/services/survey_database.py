@@ -1,12 +1,36 @@
 from __future__ import annotations
 
 import json
+import os
+import shutil
 import threading
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional, Protocol
+from typing import Any, Dict, Iterator, Optional, Protocol, Tuple
 
-from app.core.config import settings
+from app.core.config import get_settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+_COMPACTION_FACTOR = 2
+_LOCK_SHARDS = 16
 
 
 @dataclass(slots=True)
@@ -26,36 +50,153 @@ class SurveyDatabaseInterface(Protocol):
 
 
 class MockSurveyDatabase(SurveyDatabaseInterface):
-    """Simple file-backed implementation used until a real database is available."""
+    """Simple file-backed implementation used until a real database is available.
+
+    Records are appended to a JSON-lines log and mirrored in memory; the log is rewritten
+    with one line per survey once it grows past twice the number of surveys. Saves and
+    loads lock only the shard of their survey id, compaction takes every shard.
+    """
 
     def __init__(self, storage_path: Path) -> None:
         self._path = Path(storage_path)
-        self._lock = threading.Lock()
+        self._locks = tuple(threading.Lock() for _ in range(_LOCK_SHARDS))
+        self._load_lock = threading.Lock()
+        self._count_lock = threading.Lock()
+        self._records: Dict[str, Any] = {}
+        self._signature: Optional[Tuple[int, int]] = None
+        self._loaded = False
+        self._line_count = 0
+        self._needs_compaction = False
+        self._damaged = False
 
     def save_survey_results(self, record: SurveyResultRecord) -> None:
-        with self._lock:
-            payload = self._read_all_unlocked()
-            payload[record.survey_id] = self._serialize_record(record)
-            self._write_all_unlocked(payload)
+        serialized = self._serialize_record(record)
+        self._refresh_records()
+        # A legacy document or a partial trailing line would corrupt the next append, so the
+        # log is rewritten first; only writes ever touch the file.
+        if self._needs_compaction:
+            self.compact()
+        with self._lock_for(record.survey_id):
+            self._records[record.survey_id] = serialized
+            self._append(record.survey_id, serialized)
+        if self._line_count > _COMPACTION_FACTOR * len(self._records):
+            self.compact()
 
     def load_survey_results(self, survey_id: str) -> Optional[SurveyResultRecord]:
-        with self._lock:
-            payload = self._read_all_unlocked()
-            raw_record = payload.get(survey_id)
+        self._refresh_records()
+        with self._lock_for(survey_id):
+            raw_record = self._records.get(survey_id)
         if raw_record is None:
             return None
         return self._deserialize_record(survey_id, raw_record)
 
+    def compact(self) -> None:
+        """Rewrite the log with a single line per survey.
+
+        Unreadable lines are dropped by the rewrite, so a damaged file is first copied to
+        ``<name>.corrupt``.
+        """
+
+        self._refresh_records()
+        with self._all_shards():
+            if self._damaged:
+                shutil.copyfile(self._path, self._path.with_name(f"{self._path.name}.corrupt"))
+            self._compact_unlocked(self._records)
+
+    def _lock_for(self, survey_id: str) -> threading.Lock:
+        return self._locks[hash(survey_id) % _LOCK_SHARDS]
+
+    @contextmanager
+    def _all_shards(self) -> Iterator[None]:
+        with ExitStack() as stack:
+            for lock in self._locks:
+                stack.enter_context(lock)
+            yield
+
+    def _file_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self._path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _is_current(self) -> bool:
+        return self._loaded and self._file_signature() == self._signature
+
+    def _refresh_records(self) -> None:
+        """Load the log on first use and reload it whenever another writer changed the file."""
+
+        if self._is_current():
+            return
+        with self._load_lock, self._all_shards():
+            if self._is_current():
+                return
+            records = self._read_all_unlocked()
+            self._records = records
+            self._signature = self._file_signature()
+            self._loaded = True
+
     def _read_all_unlocked(self) -> Dict[str, Any]:
+        self._line_count = 0
+        self._needs_compaction = False
+        self._damaged = False
         if not self._path.is_file():
             return {}
-        try:
-            return json.loads(self._path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
+        data = self._path.read_bytes()
+        if not data.strip():
             return {}
 
-    def _write_all_unlocked(self, payload: Dict[str, Any]) -> None:
-        self._path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        # A partial trailing line would corrupt the next append; ``save_survey_results`` rewrites first.
+        self._needs_compaction = not data.endswith(b"\n")
+        try:
+            document = _loads(data)
+        except ValueError:
+            document = None
+        if isinstance(document, dict):
+            # Either a single log line or a legacy indented JSON document.
+            self._line_count = 1
+            self._needs_compaction = self._needs_compaction or b"\n" in data.strip()
+            return document
+
+        records: Dict[str, Any] = {}
+        for line in data.splitlines():
+            if not line.strip():
+                continue
+            try:
+                entry = _loads(line)
+            except ValueError:
+                entry = None
+            if isinstance(entry, dict):
+                records.update(entry)
+                self._line_count += 1
+            else:
+                self._needs_compaction = self._damaged = True
+        return records
+
+    def _append(self, survey_id: str, serialized: Dict[str, Any]) -> None:
+        # Unbuffered append mode issues one write per line, so appends from different shards never interleave.
+        with self._path.open("ab", buffering=0) as handle:
+            handle.write(_dumps({survey_id: serialized}) + b"\n")
+        with self._count_lock:
+            self._line_count += 1
+            self._signature = self._file_signature()
+
+    def _compact_unlocked(self, records: Dict[str, Any]) -> None:
+        # Write a sibling temp file and swap it in, so a crash mid-compaction never leaves a
+        # truncated results file behind.
+        temp_path = self._path.with_name(f"{self._path.name}.tmp")
+        with temp_path.open("wb") as handle:
+            handle.write(
+                b"".join(_dumps({survey_id: serialized}) + b"\n" for survey_id, serialized in records.items())
+            )
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_path, self._path)
+        with self._count_lock:
+            self._line_count = len(records)
+            self._signature = self._file_signature()
+        self._needs_compaction = False
+        self._damaged = False
 
     @staticmethod
     def _serialize_record(record: SurveyResultRecord) -> Dict[str, Any]:
@@ -69,22 +210,16 @@ class MockSurveyDatabase(SurveyDatabaseInterface):
 
     @staticmethod
     def _deserialize_record(survey_id: str, payload: Dict[str, Any]) -> SurveyResultRecord:
-        def _convert_keys(source: Dict[str, Any]) -> Dict[int, Any]:
-            converted: Dict[int, Any] = {}
-            for key, value in source.items():
-                try:
-                    converted[int(key)] = value
-                except (TypeError, ValueError):
-                    continue
-            return converted
-
+        # Keys are question indexes serialised as JSON strings; values were written from the
+        # typed record, so they are trusted as-is and only the keys need converting.
+        responses = payload.get("responses", {})
+        followups = payload.get("followups", {})
+        followup_responses = payload.get("followup_responses", {})
         return SurveyResultRecord(
             survey_id=survey_id,
-            responses={k: str(v) for k, v in _convert_keys(payload.get("responses", {})).items()},
-            followups=_convert_keys(payload.get("followups", {})),
-            followup_responses={
-                k: str(v) for k, v in _convert_keys(payload.get("followup_responses", {})).items()
-            },
+            responses={int(k): v for k, v in responses.items() if k.isdecimal()},
+            followups={int(k): v for k, v in followups.items() if k.isdecimal()},
+            followup_responses={int(k): v for k, v in followup_responses.items() if k.isdecimal()},
         )
 
 
@@ -95,11 +230,15 @@ _DATABASE_LOCK = threading.Lock()
 def get_survey_database() -> SurveyDatabaseInterface:
     """Return the shared survey database instance."""
 
+    # Not ``functools.cache``: it may run the factory twice under a race, and two instances
+    # would guard the same file with separate shard locks. Streamlit runs each session's script
+    # on its own thread, so the navigation save and the analysis data provider of concurrent
+    # sessions can make that first call together. The fast path here is lock-free.
     global _DATABASE_INSTANCE
     if _DATABASE_INSTANCE is None:
         with _DATABASE_LOCK:
             if _DATABASE_INSTANCE is None:
-                _DATABASE_INSTANCE = MockSurveyDatabase(settings.survey_results_path)
+                _DATABASE_INSTANCE = MockSurveyDatabase(get_settings().survey_results_path)
     return _DATABASE_INSTANCE
 
 
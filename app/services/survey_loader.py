@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from pathlib import Path
 from typing import Iterable, List
 
@@ -10,6 +11,14 @@ from app.models.survey import (
     SurveyQuestion,
 )
 
+# One match per non-comment line: surrounding whitespace is trimmed by the pattern and the
+# text after the first "|" (if any) is captured as the raw choice list.
+_LINE_RE = re.compile(
+    r"^(?![^\S\n]*#)[^\S\n]*(?P<question>[^|\n]*?)[^\S\n]*(?:\|(?P<choices>[^\n]*))?$",
+    re.MULTILINE,
+)
+_CHOICE_SPLIT_RE = re.compile(r"\s*,\s*")
+
 
 class SurveyLoader:
     """Load survey questions from a simple text file.
@@ -24,6 +33,8 @@ class SurveyLoader:
     beginning with "#" or that are blank are ignored.
     """
 
+    __slots__ = ("_path", "_survey")
+
     def __init__(self, source: str | Path) -> None:
         self._path = Path(source)
         if not self._path.is_file():
@@ -39,34 +50,37 @@ class SurveyLoader:
         return self._survey
 
     def _load_questions(self) -> Iterable[SurveyQuestion]:
-        with self._path.open("r", encoding="utf-8") as handle:
-            for lineno, raw_line in enumerate(handle, start=1):
-                line = raw_line.strip()
-                if not line or line.startswith("#"):
-                    continue
-
-                question_text, choices = self._parse_line(line, lineno)
-                answer = (
-                    CategoricalAnswer(choices=choices)
-                    if choices
-                    else FreeTextAnswer()
-                )
-                yield SurveyQuestion(question=question_text, answer=answer)
-
-    def _parse_line(self, line: str, lineno: int) -> tuple[str, List[str]]:
-        if "|" not in line:
-            question_text = line
-            if not question_text:
-                raise ValueError(f"Line {lineno}: question text cannot be empty")
-            return question_text, []
-
-        question_part, choices_part = line.split("|", maxsplit=1)
-        question_text = question_part.strip()
+        text = self._path.read_text(encoding="utf-8")
+        for match in _LINE_RE.finditer(text):
+            question_text, choices_part = match.group("question", "choices")
+            if not question_text and choices_part is None:
+                continue
+
+            choices = self._parse_choices(question_text, choices_part, text, match.start())
+            answer = (
+                CategoricalAnswer(choices=choices)
+                if choices
+                else FreeTextAnswer()
+            )
+            yield SurveyQuestion(question=question_text, answer=answer)
+
+    @staticmethod
+    def _parse_choices(question_text: str, choices_part: str | None, text: str, offset: int) -> List[str]:
         if not question_text:
-            raise ValueError(f"Line {lineno}: question text cannot be empty")
+            raise ValueError(f"Line {_line_number(text, offset)}: question text cannot be empty")
+        if choices_part is None:
+            return []
 
-        choices = [choice.strip() for choice in choices_part.split(",") if choice.strip()]
+        choices = [choice for choice in _CHOICE_SPLIT_RE.split(choices_part.strip()) if choice]
         if not choices:
-            raise ValueError(f"Line {lineno}: categorical question must define at least one choice")
+            raise ValueError(
+                f"Line {_line_number(text, offset)}: categorical question must define at least one choice"
+            )
+
+        return choices
+
+
+def _line_number(text: str, offset: int) -> int:
+    """Return the 1-based line number of ``offset``; only needed when reporting errors."""
 
-        return question_text, choices
+    return text.count("\n", 0, offset) + 1
@@ -21,3 +21,4 @@ if "dotenv" not in sys.modules:
 
 os.environ.setdefault("LLM_API_KEY", "test-key")
 os.environ.setdefault("LLM_MODEL", "gpt-4o-mini")
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
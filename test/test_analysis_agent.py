@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from typing import Iterator
+
+from app.models.analysis import QuestionInsight, SurveyAnalysisSnapshot
+from app.services.analysis_agent import SurveyAnalysisAgent
+from app.services.LLM import LLMInterface
+
+
+class _StubProvider:
+    def __init__(self, response: str = "Email") -> None:
+        self.response = response
+
+    def get_survey_snapshot(self, survey_id: str | None = None) -> SurveyAnalysisSnapshot:
+        return SurveyAnalysisSnapshot(
+            survey_id=survey_id or "active",
+            questions=[
+                QuestionInsight(index=0, question="Preferred contact?", answer_type="free_text", response=self.response),
+            ],
+        )
+
+
+class _FakeLLM(LLMInterface):
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.streams: list[str] = []
+
+    def __call__(self, prompt: str) -> str:
+        self.calls.append(prompt)
+        return " - Prefers email "
+
+    def stream(self, prompt: str) -> Iterator[str]:
+        self.streams.append(prompt)
+        yield from (" - Prefers", " email ")
+
+
+def _build_agent(provider: _StubProvider | None = None) -> tuple[SurveyAnalysisAgent, _FakeLLM]:
+    llm = _FakeLLM()
+    return SurveyAnalysisAgent(provider or _StubProvider(), llm=llm), llm  # type: ignore[arg-type]
+
+
+def test_answer_reuses_cached_answer_for_identical_prompt() -> None:
+    agent, llm = _build_agent()
+
+    assert agent.answer("How do people want to be contacted?") == "- Prefers email"
+    assert agent.answer("  How do people want to be contacted? ") == "- Prefers email"
+
+    assert len(llm.calls) == 1
+    assert agent.cache_hits == 1
+
+
+def test_answer_misses_cache_when_responses_change() -> None:
+    provider = _StubProvider()
+    agent, llm = _build_agent(provider)
+
+    agent.answer("Summarise")
+    provider.response = "Phone"
+    agent.answer("Summarise")
+
+    assert len(llm.calls) == 2
+    assert "Phone" in llm.calls[1]
+    assert agent.cache_hits == 0
+
+
+def test_answer_streams_tokens_to_status_callback() -> None:
+    agent, llm = _build_agent()
+    events: list[tuple[str, str]] = []
+
+    answer = agent.answer("Summarise", status_callback=lambda step, message: events.append((step, message)))
+
+    assert answer == "- Prefers email"
+    assert llm.calls == [] and len(llm.streams) == 1
+    assert [message for step, message in events if step == "token"] == [" - Prefers", " email "]
+    assert [step for step, _ in events if step != "token"] == ["fetching", "reading", "thinking", "completed"]
+
+    events.clear()
+    assert agent.answer("Summarise", status_callback=lambda step, message: events.append((step, message))) == answer
+    assert len(llm.streams) == 1
+    assert [step for step, _ in events] == ["fetching", "reading", "completed"]
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import pickle
+
+import pytest
+
+from app.models.analysis import QuestionInsight, SurveyAnalysisSnapshot
+from app.services.charts import ChartType, SurveyChartBuilder
+
+
+class _StubProvider:
+    def __init__(self, snapshot: SurveyAnalysisSnapshot) -> None:
+        self._snapshot = snapshot
+        self.snapshot_calls = 0
+
+    def get_survey_snapshot(self, survey_id: str | None = None) -> SurveyAnalysisSnapshot:
+        self.snapshot_calls += 1
+        return self._snapshot
+
+
+def _build_builder() -> tuple[SurveyChartBuilder, _StubProvider]:
+    snapshot = SurveyAnalysisSnapshot(
+        survey_id="active",
+        questions=[
+            QuestionInsight(
+                index=0,
+                question="Pick one",
+                answer_type="categorical",
+                choices=["Yes", "No"],
+                response="No",
+            ),
+            QuestionInsight(index=1, question="Skipped", answer_type="free_text"),
+            QuestionInsight(
+                index=2,
+                question="Describe it",
+                answer_type="free_text",
+                response="Fast fast and reliable",
+            ),
+        ],
+    )
+    provider = _StubProvider(snapshot)
+    return SurveyChartBuilder(provider), provider  # type: ignore[arg-type]
+
+
+def test_all_question_charts_reads_snapshot_once() -> None:
+    builder, provider = _build_builder()
+
+    charts = builder.all_question_charts()
+
+    assert provider.snapshot_calls == 1
+    assert [chart.question_index for chart in charts] == [0, 2]
+    assert charts[0].as_dict() == {"Yes": 0.0, "No": 1.0}
+    assert charts[1].to_series()[0] == ("fast", 2.0)
+    assert charts[0].metadata == {"answer_type": "categorical"}
+    assert not hasattr(charts[0], "__dict__")
+    assert pickle.loads(pickle.dumps(charts[0])) == charts[0]
+
+
+def test_question_chart_builds_pie_for_categorical_question() -> None:
+    builder, _ = _build_builder()
+
+    chart = builder.question_chart(0, chart_type="pie")
+
+    assert chart.chart_type is ChartType.PIE
+    assert chart.labels == ("Yes", "No")
+
+
+def test_question_chart_rejects_unknown_index() -> None:
+    builder, _ = _build_builder()
+
+    with pytest.raises(IndexError):
+        builder.question_chart(5)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from typing import Callable, TypeVar
+
+from pydantic_ai.messages import ModelMessage, ModelResponse, ToolCallPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+from app.services.followup_agent import FollowUpAgent
+
+T = TypeVar("T")
+
+
+def _pair_count(messages: list[ModelMessage]) -> int:
+    prompt = str(messages[-1].parts[-1].content)  # type: ignore[union-attr]
+    return int(prompt.split()[2]) if prompt.startswith("There are ") else 1
+
+
+def _decision_args(number: int) -> dict[str, object]:
+    return {"should_ask": True, "follow_up_question": f"Follow-up {number}?"}
+
+
+def _batch_model(batch_sizes: list[int], *, drop: int = 0) -> FunctionModel:
+    def _respond(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        count = _pair_count(messages)
+        batch_sizes.append(count)
+        decisions = [_decision_args(number) for number in range(count - drop)]
+        return ModelResponse(parts=[ToolCallPart(info.output_tools[0].name, {"response": decisions})])
+
+    return FunctionModel(_respond)
+
+
+def _single_model(calls: list[str]) -> FunctionModel:
+    def _respond(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        calls.append(str(messages[-1].parts[-1].content))  # type: ignore[union-attr]
+        return ModelResponse(parts=[ToolCallPart(info.output_tools[0].name, _decision_args(0))])
+
+    return FunctionModel(_respond)
+
+
+def _run(agent: FollowUpAgent, batch: FunctionModel, single: FunctionModel, action: Callable[[], T]) -> T:
+    with agent._batch_agent.override(model=batch), agent._agent.override(model=single):
+        return action()
+
+
+def test_decide_batch_chunks_pairs_and_fills_the_cache() -> None:
+    agent = FollowUpAgent()
+    batch_sizes: list[int] = []
+    single_calls: list[str] = []
+    pairs = [(f"Question {number}", f"Answer {number}") for number in range(10)]
+
+    decisions = _run(agent, _batch_model(batch_sizes), _single_model(single_calls), lambda: agent.decide_batch(pairs))
+
+    assert batch_sizes == [8, 2]
+    assert single_calls == []
+    assert [decision.follow_up_question for decision in decisions] == [
+        *(f"Follow-up {number}?" for number in range(8)),
+        "Follow-up 0?",
+        "Follow-up 1?",
+    ]
+
+    cached = _run(agent, _batch_model(batch_sizes), _single_model(single_calls), lambda: agent.decide(*pairs[9]))
+
+    assert cached.follow_up_question == "Follow-up 1?"
+    assert agent.cache_hits == 1
+    assert batch_sizes == [8, 2] and single_calls == []
+
+
+def test_decide_batch_falls_back_to_single_runs_on_count_mismatch() -> None:
+    agent = FollowUpAgent()
+    batch_sizes: list[int] = []
+    single_calls: list[str] = []
+    pairs = [(f"Question {number}", f"Answer {number}") for number in range(3)]
+
+    decisions = _run(
+        agent,
+        _batch_model(batch_sizes, drop=1),
+        _single_model(single_calls),
+        lambda: agent.decide_batch(pairs),
+    )
+
+    assert batch_sizes == [3]
+    assert len(single_calls) == 3
+    assert len(decisions) == 3
+
+
+def test_decide_batch_runs_single_pairs_through_decide() -> None:
+    agent = FollowUpAgent()
+    batch_sizes: list[int] = []
+    single_calls: list[str] = []
+
+    decisions = _run(
+        agent,
+        _batch_model(batch_sizes),
+        _single_model(single_calls),
+        lambda: agent.decide_batch([("Question", "Answer")]),
+    )
+
+    assert batch_sizes == []
+    assert len(single_calls) == 1
+    assert decisions[0].should_ask is True
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from typing import Iterator
+
+import pytest
+from langchain_core.caches import InMemoryCache
+from langchain_core.globals import get_llm_cache, set_llm_cache
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from app.services.LLM import LLM
+
+
+@pytest.fixture
+def llm_cache() -> Iterator[InMemoryCache]:
+    previous = get_llm_cache()
+    cache = InMemoryCache()
+    set_llm_cache(cache)
+    yield cache
+    set_llm_cache(previous)
+
+
+def _build_llm(*responses: str) -> LLM:
+    llm = LLM()
+    llm._client = FakeListChatModel(responses=list(responses))  # type: ignore[assignment]
+    return llm
+
+
+def test_stream_reads_and_fills_the_llm_cache(llm_cache: InMemoryCache) -> None:
+    llm = _build_llm("cached answer", "streamed answer")
+
+    assert llm("first prompt") == "cached answer"
+    assert list(llm.stream("first prompt")) == ["cached answer"]
+
+    assert "".join(llm.stream("second prompt")) == "streamed answer"
+    assert list(llm.stream("second prompt")) == ["streamed answer"]
+    assert llm("second prompt") == "streamed answer"
+
+
+def test_stream_without_cache_yields_chunks() -> None:
+    previous = get_llm_cache()
+    set_llm_cache(None)
+    try:
+        llm = _build_llm("hi")
+        assert list(llm.stream("prompt")) == ["h", "i"]
+    finally:
+        set_llm_cache(previous)
+
+
+def test_stream_skips_the_cache_when_the_cache_key_is_unavailable(
+    llm_cache: InMemoryCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    llm = _build_llm("hi", "hi")
+    monkeypatch.setattr(type(llm._client), "_get_llm_string", None)
+
+    assert list(llm.stream("prompt")) == ["h", "i"]
+    assert list(llm.stream("prompt")) == ["h", "i"]
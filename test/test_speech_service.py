@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import asyncio
+import io
 import types
+import wave
+from dataclasses import replace
 
 import pytest
 
 from app.core.config import SpeechSettings
+from app.services.speech import create_speech_service
 from app.services.speech.base import SpeechServiceError
-from app.services.speech.openai_service import OpenAISpeechService
+from app.services.speech.openai_service import OpenAISpeechService, _downsample_wav
 
 
 class _DummySpeechResponse:
@@ -48,8 +53,8 @@ def test_transcribe_uses_response_object_text(monkeypatch: pytest.MonkeyPatch) -
     captured_filename: dict[str, str] = {}
 
     def _fake_create(**kwargs: object) -> object:
-        file_obj = kwargs["file"]
-        captured_filename["value"] = getattr(file_obj, "name", "")
+        filename, _, _ = kwargs["file"]  # type: ignore[misc]
+        captured_filename["value"] = filename
         return types.SimpleNamespace(text="example output")
 
     monkeypatch.setattr(service._client.audio.transcriptions, "create", _fake_create)
@@ -60,6 +65,57 @@ def test_transcribe_uses_response_object_text(monkeypatch: pytest.MonkeyPatch) -
     assert captured_filename["value"].endswith(".mp3")
 
 
+def test_resolve_extension_ignores_mime_parameters() -> None:
+    assert OpenAISpeechService._resolve_extension("audio/mpeg; charset=binary") == ".mp3"
+
+
+def test_transcribe_downsamples_wav_when_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = OpenAISpeechService(
+        api_key="test-key",
+        settings=SpeechSettings(
+            provider="openai",
+            stt_model="whisper-1",
+            tts_model="gpt-4o-mini-tts",
+            tts_voice="alloy",
+            tts_format="mp3",
+            preprocess_audio=True,
+        ),
+    )
+
+    source = io.BytesIO()
+    with wave.open(source, "wb") as writer:
+        writer.setnchannels(2)
+        writer.setsampwidth(2)
+        writer.setframerate(48_000)
+        writer.writeframes(b"\x01\x00\x02\x00" * 4800)
+
+    uploaded: dict[str, bytes] = {}
+
+    def _fake_create(**kwargs: object) -> str:
+        _, uploaded["value"], _ = kwargs["file"]  # type: ignore[misc]
+        return "ok"
+
+    monkeypatch.setattr(service._client.audio.transcriptions, "create", _fake_create)
+
+    assert service.transcribe(source.getvalue(), mime_type="audio/wav") == "ok"
+    with wave.open(io.BytesIO(uploaded["value"]), "rb") as reader:
+        assert (reader.getnchannels(), reader.getframerate(), reader.getnframes()) == (1, 16_000, 1600)
+        assert reader.readframes(1) == b"\x01\x00"
+
+
+def test_downsample_wav_averages_channels_and_tolerates_truncated_data() -> None:
+    source = io.BytesIO()
+    with wave.open(source, "wb") as writer:
+        writer.setnchannels(2)
+        writer.setsampwidth(2)
+        writer.setframerate(48_000)
+        writer.writeframes(b"\x64\x00\x38\xff" * 7)
+
+    with wave.open(io.BytesIO(_downsample_wav(source.getvalue()[:-1])), "rb") as reader:
+        assert (reader.getnchannels(), reader.getframerate(), reader.getnframes()) == (1, 16_000, 2)
+        assert reader.readframes(2) == b"\xce\xff" * 2
+
+
 def test_transcribe_raises_when_response_empty(monkeypatch: pytest.MonkeyPatch) -> None:
     service = _build_service()
 
@@ -81,6 +137,23 @@ def test_synthesize_returns_audio_bytes(monkeypatch: pytest.MonkeyPatch) -> None
     assert dummy_response.closed is True
 
 
+def test_synthesize_reuses_cached_audio(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = _build_service()
+
+    calls: list[str] = []
+
+    def _fake_create(**kwargs: object) -> _DummySpeechResponse:
+        calls.append(str(kwargs["voice"]))
+        return _DummySpeechResponse(b"audio-bytes")
+
+    monkeypatch.setattr(service._client.audio.speech, "create", _fake_create)
+
+    assert service.synthesize("Hello world") == b"audio-bytes"
+    assert service.synthesize("  Hello world ") == b"audio-bytes"
+    assert service.synthesize("Hello world", voice="nova") == b"audio-bytes"
+    assert calls == ["alloy", "nova"]
+
+
 def test_synthesize_raises_when_empty_response(monkeypatch: pytest.MonkeyPatch) -> None:
     service = _build_service()
 
@@ -90,3 +163,81 @@ def test_synthesize_raises_when_empty_response(monkeypatch: pytest.MonkeyPatch)
     with pytest.raises(SpeechServiceError):
         service.synthesize("Hello world")
 
+
+def test_async_wrappers_delegate_to_sync_methods(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = _build_service()
+
+    monkeypatch.setattr(service._client.audio.transcriptions, "create", lambda **_: "  spoken  ")
+    monkeypatch.setattr(service._client.audio.speech, "create", lambda **_: _DummySpeechResponse(b"async-audio"))
+
+    async def _run() -> list[object]:
+        return await asyncio.gather(service.transcribe_async(b"\x00"), service.synthesize_async("Hello"))
+
+    assert asyncio.run(_run()) == ["spoken", b"async-audio"]
+
+
+def test_synthesize_sentences_yields_chunks_in_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = _build_service()
+
+    def _fake_create(**kwargs: object) -> _DummySpeechResponse:
+        return _DummySpeechResponse(str(kwargs["input"]).encode())
+
+    monkeypatch.setattr(service._client.audio.speech, "create", _fake_create)
+
+    chunks = list(service.synthesize_sentences("One. Two! Three?", response_format="pcm"))
+
+    assert chunks == [b"One.", b"Two!", b"Three?"]
+
+
+def test_synthesize_sentences_rejects_container_formats() -> None:
+    service = _build_service()
+
+    with pytest.raises(ValueError):
+        next(service.synthesize_sentences("One. Two!", response_format="wav"))
+
+
+def test_synthesize_stream_yields_chunks_and_caches_audio(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = _build_service()
+
+    class _StreamingResponse:
+        def __enter__(self) -> "_StreamingResponse":
+            return self
+
+        def __exit__(self, *_: object) -> None:
+            return None
+
+        def iter_bytes(self, chunk_size: int) -> list[bytes]:
+            assert chunk_size == 4096
+            return [b"au", b"dio"]
+
+    calls: list[object] = []
+
+    def _fake_create(**kwargs: object) -> _StreamingResponse:
+        calls.append(kwargs["input"])
+        return _StreamingResponse()
+
+    monkeypatch.setattr(
+        service._client.audio.speech,
+        "with_streaming_response",
+        types.SimpleNamespace(create=_fake_create),
+    )
+
+    assert list(service.synthesize_stream("Hello world")) == [b"au", b"dio"]
+    assert list(service.synthesize_stream("Hello world")) == [b"audio"]
+    assert service.synthesize("Hello world") == b"audio"
+    assert calls == ["Hello world"]
+
+
+def test_create_speech_service_normalises_provider_and_rejects_unknown_ones() -> None:
+    settings = SpeechSettings(
+        provider=" OpenAI ",
+        stt_model="whisper-1",
+        tts_model="gpt-4o-mini-tts",
+        tts_voice="alloy",
+        tts_format="mp3",
+    )
+
+    assert isinstance(create_speech_service(api_key="test-key", settings=settings), OpenAISpeechService)
+
+    with pytest.raises(SpeechServiceError, match="Unsupported speech provider"):
+        create_speech_service(api_key="test-key", settings=replace(settings, provider="google"))
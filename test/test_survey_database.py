@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from app.services.survey_database import MockSurveyDatabase, SurveyResultRecord
+
+
+def _build_record(survey_id: str = "active") -> SurveyResultRecord:
+    return SurveyResultRecord(
+        survey_id=survey_id,
+        responses={0: "Email", 2: "Faster support"},
+        followups={2: {"text": "What would faster look like?", "displayed": True}},
+        followup_responses={2: "Replies within a day"},
+    )
+
+
+def test_save_and_load_round_trip(tmp_path: Path) -> None:
+    database = MockSurveyDatabase(tmp_path / "results.json")
+
+    database.save_survey_results(_build_record())
+
+    assert database.load_survey_results("active") == _build_record()
+    assert database.load_survey_results("missing") is None
+
+
+def test_save_keeps_other_surveys(tmp_path: Path) -> None:
+    database = MockSurveyDatabase(tmp_path / "results.json")
+
+    database.save_survey_results(_build_record("first"))
+    database.save_survey_results(_build_record("second"))
+
+    reopened = MockSurveyDatabase(tmp_path / "results.json")
+    assert reopened.load_survey_results("first") == _build_record("first")
+    assert reopened.load_survey_results("second") == _build_record("second")
+
+
+def test_load_picks_up_changes_from_another_writer(tmp_path: Path) -> None:
+    path = tmp_path / "results.json"
+    reader = MockSurveyDatabase(path)
+    assert reader.load_survey_results("active") is None
+
+    MockSurveyDatabase(path).save_survey_results(_build_record())
+
+    assert reader.load_survey_results("active") == _build_record()
+
+
+def test_load_ignores_corrupt_file(tmp_path: Path) -> None:
+    path = tmp_path / "results.json"
+    path.write_text("{not json", encoding="utf-8")
+
+    assert MockSurveyDatabase(path).load_survey_results("active") is None
+    assert path.read_bytes() == b"{not json"
+
+
+def test_save_keeps_copy_of_corrupt_file(tmp_path: Path) -> None:
+    path = tmp_path / "results.json"
+    path.write_text("{not json", encoding="utf-8")
+    database = MockSurveyDatabase(path)
+
+    database.save_survey_results(_build_record())
+
+    assert (tmp_path / "results.json.corrupt").read_bytes() == b"{not json"
+    assert MockSurveyDatabase(path).load_survey_results("active") == _build_record()
+
+
+def test_saves_append_and_compact_the_log(tmp_path: Path) -> None:
+    path = tmp_path / "results.json"
+    database = MockSurveyDatabase(path)
+
+    database.save_survey_results(_build_record("first"))
+    database.save_survey_results(_build_record("second"))
+    database.save_survey_results(_build_record("first"))
+    assert len(path.read_bytes().splitlines()) == 3
+
+    database.save_survey_results(_build_record("first"))
+    database.save_survey_results(_build_record("first"))
+    assert len(path.read_bytes().splitlines()) == 2
+    assert MockSurveyDatabase(path).load_survey_results("first") == _build_record("first")
+
+
+def test_reads_legacy_json_document(tmp_path: Path) -> None:
+    path = tmp_path / "results.json"
+    path.write_text(
+        json.dumps({"active": {"responses": {"0": "Email"}, "followups": {}, "followup_responses": {}}}, indent=2),
+        encoding="utf-8",
+    )
+    database = MockSurveyDatabase(path)
+
+    assert database.load_survey_results("active").responses == {0: "Email"}  # type: ignore[union-attr]
+
+    database.save_survey_results(_build_record("second"))
+    reopened = MockSurveyDatabase(path)
+    assert reopened.load_survey_results("active").responses == {0: "Email"}  # type: ignore[union-attr]
+    assert reopened.load_survey_results("second") == _build_record("second")
+
+
+def test_compact_replaces_file_without_leaving_temp_file(tmp_path: Path) -> None:
+    path = tmp_path / "results.json"
+    database = MockSurveyDatabase(path)
+    database.save_survey_results(_build_record())
+    database.save_survey_results(_build_record())
+
+    database.compact()
+
+    assert path.read_text(encoding="utf-8").count("\n") == 1
+    assert sorted(item.name for item in tmp_path.iterdir()) == ["results.json"]
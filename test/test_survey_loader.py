@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from app.services.survey_loader import SurveyLoader
+
+
+def _write_survey(tmp_path: Path, content: str) -> Path:
+    path = tmp_path / "survey.txt"
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def test_parses_free_text_and_categorical_questions(tmp_path: Path) -> None:
+    path = _write_survey(
+        tmp_path,
+        "# comment\n\n  How was it?  \nPick one |  Red ,Blue,, Green  \n   # indented comment\n",
+    )
+
+    questions = SurveyLoader(path).survey.questions
+
+    assert [question.question for question in questions] == ["How was it?", "Pick one"]
+    assert questions[0].answer.type == "free_text"
+    assert questions[1].answer.choices == ["Red", "Blue", "Green"]
+
+
+def test_only_first_pipe_separates_choices(tmp_path: Path) -> None:
+    path = _write_survey(tmp_path, "Question | a | b, c")
+
+    (question,) = SurveyLoader(path).survey.questions
+
+    assert question.answer.choices == ["a | b", "c"]
+
+
+@pytest.mark.parametrize(
+    ("content", "message"),
+    [
+        ("First\n\n | a, b\n", "Line 3: question text cannot be empty"),
+        ("First\nSecond | , \n", "Line 2: categorical question must define at least one choice"),
+    ],
+)
+def test_invalid_lines_report_line_numbers(tmp_path: Path, content: str, message: str) -> None:
+    path = _write_survey(tmp_path, content)
+
+    with pytest.raises(ValueError, match=message):
+        SurveyLoader(path)